@@ -5,6 +5,8 @@ Example usage of the F1 Race Analyzer
 This script demonstrates how to use the F1RaceAnalyzer class programmatically.
 """
 
+from itertools import islice
+
 from race_analyzer import F1RaceAnalyzer
 
 
@@ -56,9 +58,8 @@ def example_analyze_specific_segments():
             print(f"  Lap {incident['lap']}: {incident['message']}")
         
         # Analyze only major position changes
-        position_changes = analyzer.analyze_position_changes(min_change=5)
-        print(f"\nFound {len(position_changes)} major position changes:")
-        for change in position_changes[:5]:
+        print(f"\nFound {analyzer.count_position_changes(min_change=5)} major position changes:")
+        for change in islice(analyzer.iter_position_changes(min_change=5), 5):
             print(f"  {change['driver']} Lap {change['lap']}: {change['from_position']} → {change['to_position']} ({change['change']:+d})")
         
         # Analyze pit stop strategies
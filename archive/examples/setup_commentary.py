@@ -6,6 +6,7 @@ This script helps set up the commentary generator by checking dependencies
 and providing instructions for API key setup.
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
@@ -25,10 +26,10 @@ def check_dependencies():
     missing_packages = []
     
     for package in required_packages:
-        try:
-            __import__(package)
+        # Locate the package without importing it (fastf1 alone pulls in matplotlib and scipy)
+        if importlib.util.find_spec(package) is not None:
             print(f"✓ {package}")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"✗ {package} (missing)")
     
@@ -21,7 +21,8 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 import numpy as np
@@ -386,10 +387,39 @@ class F1RaceAnalyzer:
     
     def analyze_position_changes(self, min_change: int = 3) -> List[Dict]:
         """Analyze significant position changes with telemetry data."""
+        return list(self.iter_position_changes(min_change=min_change))
+    
+    def iter_position_changes(self, min_change: int = 3) -> Iterator[Dict]:
+        """
+        Yield significant position changes, biggest changes first.
+        
+        Telemetry comparisons are only computed as each change is yielded, so
+        callers that need just the top few changes can stop early.
+        """
+        for driver, prev_lap, curr_lap, change in self._find_position_changes(min_change):
+            yield {
+                'driver': driver,
+                'lap': int(curr_lap['LapNumber']),
+                'from_position': int(prev_lap['Position']),
+                'to_position': int(curr_lap['Position']),
+                'change': int(change),
+                'lap_time': str(curr_lap['LapTime']),
+                'prev_lap_time': str(prev_lap['LapTime']),
+                'compound': curr_lap.get('Compound', 'Unknown'),
+                'tyre_life': int(curr_lap.get('TyreLife', 0)) if not pd.isna(curr_lap.get('TyreLife')) else None,
+                'telemetry_comparison': self._compare_lap_telemetry(prev_lap, curr_lap)
+            }
+    
+    def count_position_changes(self, min_change: int = 3) -> int:
+        """Count significant position changes without building telemetry comparisons."""
+        return len(self._find_position_changes(min_change))
+    
+    def _find_position_changes(self, min_change: int) -> List[Tuple[str, pd.Series, pd.Series, float]]:
+        """Find (driver, prev_lap, curr_lap, change) tuples sorted by absolute change."""
         if self.lap_data is None:
             return []
         
-        position_changes = []
+        candidates = []
         
         for driver in self.lap_data['Driver'].unique():
             driver_laps = self.lap_data[self.lap_data['Driver'] == driver].sort_values('LapNumber')
@@ -406,25 +436,11 @@ class F1RaceAnalyzer:
                         change = prev_pos - curr_pos
                         
                         if abs(change) >= min_change:
-                            # Get telemetry comparison
-                            telemetry_comparison = self._compare_lap_telemetry(prev_lap, curr_lap)
-                            
-                            position_changes.append({
-                                'driver': driver,
-                                'lap': int(curr_lap['LapNumber']),
-                                'from_position': int(prev_pos),
-                                'to_position': int(curr_pos),
-                                'change': int(change),
-                                'lap_time': str(curr_lap['LapTime']),
-                                'prev_lap_time': str(prev_lap['LapTime']),
-                                'compound': curr_lap.get('Compound', 'Unknown'),
-                                'tyre_life': int(curr_lap.get('TyreLife', 0)) if not pd.isna(curr_lap.get('TyreLife')) else None,
-                                'telemetry_comparison': telemetry_comparison
-                            })
+                            candidates.append((driver, prev_lap, curr_lap, change))
         
         # Sort by absolute change (biggest changes first)
-        position_changes.sort(key=lambda x: abs(x['change']), reverse=True)
-        return position_changes
+        candidates.sort(key=lambda c: abs(c[3]), reverse=True)
+        return candidates
     
     def _compare_lap_telemetry(self, prev_lap: pd.Series, curr_lap: pd.Series) -> Dict:
         """Compare telemetry data between two laps."""
@@ -713,7 +729,7 @@ class F1RaceAnalyzer:
         
         # Get all analysis data
         incidents = self.analyze_incidents()
-        position_changes = self.analyze_position_changes(min_change=5)  # Only major changes
+        position_changes = islice(self.iter_position_changes(min_change=5), 5)  # Top 5 major changes
         track_limits = self.analyze_track_limits_violations()
         yellow_flags = self.analyze_yellow_flags()
         
@@ -732,7 +748,7 @@ class F1RaceAnalyzer:
             })
         
         # Priority 2: Major position changes
-        for change in position_changes[:5]:  # Top 5 biggest changes
+        for change in position_changes:
             segments.append({
                 'priority': 2,
                 'type': 'position_change',
@@ -16,10 +16,32 @@ from pathlib import Path
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from f1_commentary import F1DataCollector, F1RaceAnalyzer, F1CommentaryGenerator
 from f1_commentary.config import get_settings, APIKeyManager
 
 
+def load_race_data(path: Path, keys) -> dict:
+    """
+    Load only the given top-level keys from an analysis JSON file.
+    
+    Streams the file with ijson when it is installed, so only one top-level
+    section is held in memory at a time. Falls back to json.load otherwise.
+    """
+    try:
+        import ijson
+    except ImportError:
+        import json
+        with open(path, 'r') as f:
+            race_data = json.load(f)
+        return {key: race_data[key] for key in keys if key in race_data}
+    
+    race_data = {}
+    with open(path, 'rb') as f:
+        for key, value in ijson.kvitems(f, '', use_float=True):
+            if key in keys:
+                race_data[key] = value
+    return race_data
+
+
 def main():
     """Run the basic usage example."""
     print("F1 Commentary - Basic Usage Example")
@@ -39,6 +61,8 @@ def main():
     # Example 1: Collect race data
     print("\n1. Collecting F1 race data...")
     try:
+        from f1_commentary import F1DataCollector
+        
         collector = F1DataCollector()
         
         # Load a session (this will download data if not cached)
@@ -66,6 +90,8 @@ def main():
     # Example 2: Analyze race data
     print("\n2. Analyzing race data...")
     try:
+        from f1_commentary import F1RaceAnalyzer
+        
         analyzer = F1RaceAnalyzer("./example_output")
         
         if analyzer.load_race_data("Hungary"):
@@ -93,16 +119,17 @@ def main():
     if key_manager.has_key('groq_api_key'):
         print("\n3. Generating commentary...")
         try:
+            import json
+            from f1_commentary import F1CommentaryGenerator
+            
             generator = F1CommentaryGenerator(key_manager.get_groq_key())
             
             # Load analysis results
-            import json
             analysis_files = list(Path("./example_analysis").glob("race_analysis_*.json"))
             if analysis_files:
                 latest_analysis = max(analysis_files, key=lambda p: p.stat().st_mtime)
                 
-                with open(latest_analysis, 'r') as f:
-                    race_data = json.load(f)
+                race_data = load_race_data(latest_analysis, F1CommentaryGenerator.RACE_DATA_KEYS)
                 
                 # Generate commentary
                 commentaries = generator.process_race_data(race_data)
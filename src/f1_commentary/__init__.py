@@ -16,10 +16,15 @@ Modules:
 __version__ = "1.0.0"
 __author__ = "F1 Commentary Team"
 
-from .data import F1DataCollector
-from .analysis import F1RaceAnalyzer
-from .commentary import F1CommentaryGenerator
-from .visualization import F1IncidentVisualizer
+from ._lazy import lazy_getattr
+
+# Public name -> submodule defining it, imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "F1DataCollector": ".data",
+    "F1RaceAnalyzer": ".analysis",
+    "F1CommentaryGenerator": ".commentary",
+    "F1IncidentVisualizer": ".visualization",
+}
 
 __all__ = [
     "F1DataCollector",
@@ -27,3 +32,5 @@ __all__ = [
     "F1CommentaryGenerator",
     "F1IncidentVisualizer"
 ]
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
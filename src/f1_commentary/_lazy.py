@@ -0,0 +1,29 @@
+"""
+Lazy package exports (PEP 562).
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict
+
+
+def lazy_getattr(package: str, imports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module ``__getattr__`` that imports public names on first access.
+
+    Args:
+        package: Name of the package the hook is installed in (its ``__name__``)
+        imports: Public name -> relative submodule defining it
+
+    Returns:
+        Callable: The ``__getattr__`` hook for the package
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in imports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(imports[name], package), name)
+        # Cache on the package so later lookups skip this hook
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
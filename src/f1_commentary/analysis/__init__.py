@@ -2,8 +2,15 @@
 F1 race analysis module.
 """
 
-from .analyzer import F1RaceAnalyzer
-from .incident_detector import IncidentDetector
-from .telemetry_analyzer import TelemetryAnalyzer
+from .._lazy import lazy_getattr
+
+# Public name -> submodule defining it, imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "F1RaceAnalyzer": ".analyzer",
+    "IncidentDetector": ".incident_detector",
+    "TelemetryAnalyzer": ".telemetry_analyzer",
+}
 
 __all__ = ["F1RaceAnalyzer", "IncidentDetector", "TelemetryAnalyzer"]
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
@@ -16,23 +16,245 @@ Usage:
 """
 
 import argparse
-import json
+import copy
+import io
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import pandas as pd
 import numpy as np
 
+from ..utils.file_utils import write_json
+
+try:
+    import ahocorasick
+except ImportError:  # Optional; fall back to one substring scan per keyword
+    ahocorasick = None
+
+try:
+    import polars as pl
+except ImportError:  # Optional; fall back to pandas aggregations
+    pl = None
+
+
+# Race control message patterns, compiled once
+INCIDENT_KEYWORDS = ['INCIDENT', 'CRASH', 'COLLISION', 'OFF TRACK', 'SPIN', 'CONTACT']
+TRACK_LIMITS_KEYWORDS = ['TRACK LIMITS', 'DELETED']
+YELLOW_KEYWORDS = ['YELLOW']
+_INCIDENT_RE = re.compile('|'.join(INCIDENT_KEYWORDS), re.IGNORECASE)
+_TRACK_LIMITS_RE = re.compile('|'.join(TRACK_LIMITS_KEYWORDS), re.IGNORECASE)
+_YELLOW_RE = re.compile('|'.join(YELLOW_KEYWORDS), re.IGNORECASE)
+
+# Message categories tagged in one scan of race control: (pattern, literal keywords).
+# A message can fall into several categories, e.g. a yellow flag for an incident.
+MESSAGE_CATEGORIES = {
+    'incident': (_INCIDENT_RE, INCIDENT_KEYWORDS),
+    'track_limits': (_TRACK_LIMITS_RE, TRACK_LIMITS_KEYWORDS),
+    'yellow': (_YELLOW_RE, YELLOW_KEYWORDS),
+}
+_ANY_CATEGORY_PATTERN = '|'.join(
+    re.escape(keyword) for _, keywords in MESSAGE_CATEGORIES.values() for keyword in keywords
+)
+_CAR_RE = re.compile(r'CAR (\d+)')
+_TIME_RE = re.compile(r'TIME ([0-9:\.]+)')
+_TURN_RE = re.compile(r'TURN (\d+)')
+
+# Columns the analysis reads; anything else in the CSVs is skipped at parse time
+LAP_COLUMNS = [
+    'Driver', 'LapNumber', 'Position', 'LapTime', 'Sector1Time', 'Sector2Time', 'Sector3Time',
+    'SpeedI1', 'SpeedI2', 'SpeedFL', 'SpeedST', 'Compound', 'TyreLife', 'IsPersonalBest',
+    'TrackStatus', 'PitInTime'
+]
+RACE_CONTROL_COLUMNS = ['Time', 'Lap', 'Message', 'Category', 'Sector']
+
+# Narrower nullable integer types for the lap columns on the groupby/shift/merge paths
+LAP_DTYPES = {'Position': 'Int8', 'LapNumber': 'Int16'}
+
+# Weather channels summarised in the analysis: column -> (output key, unit)
+WEATHER_CHANNELS = {
+    'AirTemp': ('air_temperature', 'Celsius'),
+    'TrackTemp': ('track_temperature', 'Celsius'),
+    'Humidity': ('humidity', 'percent'),
+    'Pressure': ('pressure', 'hPa'),
+    'WindSpeed': ('wind_speed', 'm/s'),
+}
+
+# Data points each commentary segment type draws on; shared read-only by every segment of that type
+SEGMENT_DATA_POINTS = {
+    'collision': ('positions', 'lap_times', 'steward_investigation', 'yellow_flag'),
+    'position_change': ('position_change', 'lap_times', 'tire_compound'),
+    'track_limits': ('steward_decision', 'track_limits', 'racing_standards'),
+    'yellow_flag': ('track_status', 'safety_periods', 'race_impact'),
+}
+
+# Car data channels summarised per lap
+TELEMETRY_COLUMNS = ['SessionTime', 'RPM', 'Throttle', 'Brake', 'Speed', 'nGear', 'DRS']
+
+# Laps examined around an incident: two before, the incident lap, two after
+INCIDENT_WINDOW_BEFORE = 2
+INCIDENT_WINDOW_SIZE = 5
+
+# Laps examined around a track limits violation: one before, the violation lap, one after
+VIOLATION_WINDOW_BEFORE = 1
+VIOLATION_WINDOW_SIZE = 3
+
+
+def _window_stats(values: np.ndarray, incident_index: int) -> Tuple[int, float, float, float, float]:
+    """
+    Summarise one value per lap across an incident window (NaN where missing).
+    
+    Returns (count, min, max, incident value, change from the lap before into
+    the incident lap); the last two are NaN when those laps are missing.
+    """
+    present = values[~np.isnan(values)]
+    if present.size == 0:
+        return 0, np.nan, np.nan, np.nan, np.nan
+    at_incident = values[incident_index]
+    change = at_incident - values[incident_index - 1] if incident_index > 0 else np.nan
+    return present.size, present.min(), present.max(), at_incident, change
+
+
+class MessageDetails(NamedTuple):
+    """Details parsed from a race control message."""
+    cars: Tuple[str, ...]
+    deleted_time: Optional[str]
+    turn: Optional[str]
+
+
+class PositionChange(NamedTuple):
+    """A lap-on-lap position change for one driver."""
+    driver: str
+    prev_lap: pd.Series
+    curr_lap: pd.Series
+    change: float
+
+
+@lru_cache(maxsize=4096)
+def _parse_message(message: str) -> MessageDetails:
+    """
+    Extract car numbers, deleted lap time and turn from a race control message.
+    
+    Cached because the same message text is parsed by several analyses
+    (e.g. a track limits message that also reports an incident).
+    """
+    cars = tuple(_CAR_RE.findall(message)) if 'CAR ' in message else ()
+    time_match = _TIME_RE.search(message) if 'TIME ' in message else None
+    turn_match = _TURN_RE.search(message) if 'TURN ' in message else None
+    return MessageDetails(cars, time_match.group(1) if time_match else None,
+                          turn_match.group(1) if turn_match else None)
+
+
+def _weather_stats(weather: pd.DataFrame) -> Dict[str, Tuple[float, float, float]]:
+    """Get (min, max, mean) of each WEATHER_CHANNELS column from one aggregation."""
+    columns = list(WEATHER_CHANNELS)
+    if pl is not None:
+        # One multi-threaded Polars query over all channels
+        stats = pl.from_pandas(weather[columns]).cast(pl.Float64).select(
+            pl.all().min().name.suffix('_min'),
+            pl.all().max().name.suffix('_max'),
+            pl.all().mean().name.suffix('_mean'),
+        ).row(0, named=True)
+        # Polars reports an all-missing channel as None where pandas gives NaN
+        return {
+            column: tuple(np.nan if stats[f'{column}_{stat}'] is None else stats[f'{column}_{stat}']
+                          for stat in ('min', 'max', 'mean'))
+            for column in columns
+        }
+    
+    stats = weather[columns].agg(['min', 'max', 'mean'])
+    return {column: tuple(stats[column].tolist()) for column in columns}
+
+
+def _build_weather(stats: Dict[str, Tuple[float, float, float]], rainfall: str) -> Dict:
+    """Shape _weather_stats output into the weather summary."""
+    summary = {
+        key: {'min': stats[column][0], 'max': stats[column][1], 'avg': stats[column][2], 'unit': unit}
+        for column, (key, unit) in WEATHER_CHANNELS.items()
+    }
+    summary['rainfall'] = rainfall
+    return summary
+
+
+@lru_cache(maxsize=None)
+def _keyword_automaton():
+    """Build an Aho-Corasick automaton matching every category keyword in one pass."""
+    automaton = ahocorasick.Automaton()
+    for _, keywords in MESSAGE_CATEGORIES.values():
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _read_csv_columns(path: Path, columns: List[str]) -> pd.DataFrame:
+    """Read only the given columns (those present in the file) with the pyarrow CSV parser."""
+    header = pd.read_csv(path, nrows=0).columns
+    frame = pd.read_csv(path, usecols=[c for c in header if c in columns], engine='pyarrow')
+    
+    # pyarrow leaves missing text as None; the analysis formats missing values as NaN
+    text = frame.select_dtypes(include='object').columns
+    frame[text] = frame[text].where(frame[text].notna(), np.nan)
+    return frame
+
+
+def _downcast_columns(frame: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """Cast columns to narrower dtypes where every value fits, leaving the others as read."""
+    for column, dtype in dtypes.items():
+        if column in frame.columns:
+            try:
+                frame[column] = frame[column].astype(dtype)
+            except (TypeError, ValueError):
+                pass  # Fractional or out-of-range values; keep the original dtype
+    return frame
+
+
+def _memoize_analysis(method):
+    """
+    Cache an analysis method's result per call arguments.
+    
+    The cache is dropped whenever the race data it was computed from (the
+    loaded frames, race or season) is replaced, so callers that share
+    results, like the segments and statistics, reuse one computation.
+    Each call returns its own deep copy, so a caller modifying a result
+    cannot change what later calls see.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        sources = (self.lap_data, self.race_control, self.session_results, self.race_name, self.year)
+        if (self._analysis_cache_sources is None
+                or any(a is not b for a, b in zip(sources, self._analysis_cache_sources))):
+            self._analysis_cache.clear()
+            self._analysis_cache_sources = sources
+        
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._analysis_cache:
+            self._analysis_cache[key] = method(self, *args, **kwargs)
+        return copy.deepcopy(self._analysis_cache[key])
+    return wrapper
+
 
 class F1RaceAnalyzer:
     """Comprehensive F1 race analysis tool."""
     
-    def __init__(self, data_dir: str):
-        """Initialize the analyzer with race data directory."""
+    def __init__(self, data_dir: str, year: int = 2024):
+        """
+        Initialize the analyzer with race data directory.
+        
+        Args:
+            data_dir: Directory containing collected race data
+            year: Season of the race, used to fetch car telemetry from FastF1
+        """
         self.data_dir = Path(data_dir)
+        self.year = year
+        self.race_name = None
         self.lap_data = None
         self.race_control = None
         self.track_status = None
@@ -40,6 +262,23 @@ class F1RaceAnalyzer:
         self.weather_data = None
         self.session_status = None
         self.analysis_results = {}
+        self._lap_index = {}
+        self._lap_index_source = None
+        self._ordered_laps = None
+        self._ordered_laps_source = None
+        self._car_numbers = {}
+        self._car_numbers_source = None
+        self._message_masks = {}
+        self._message_masks_source = None
+        self._session = None
+        self._telemetry_stats = None
+        # Per-(driver, lap) snapshots shared by the incident and violation analyses
+        self._driver_lap_snapshot = lru_cache(maxsize=4096)(self._driver_lap_snapshot_impl)
+        self._snapshot_source = None
+        self._position_changes = None
+        self._position_changes_source = None
+        self._analysis_cache = {}
+        self._analysis_cache_sources = None
         
     def load_race_data(self, race_name: str) -> bool:
         """
@@ -55,7 +294,8 @@ class F1RaceAnalyzer:
             # Find the most recent data files for this race
             csv_dir = None
             for item in self.data_dir.iterdir():
-                if item.is_dir() and race_name.lower().replace(" ", " ") in item.name.lower():
+                if (item.is_dir() and race_name.lower().replace(" ", " ") in item.name.lower()
+                        and (item / 'lap_data.csv').exists()):
                     csv_dir = item
                     break
             
@@ -64,13 +304,22 @@ class F1RaceAnalyzer:
                 return False
             
             # Load all CSV files
-            self.lap_data = pd.read_csv(csv_dir / 'lap_data.csv')
-            self.race_control = pd.read_csv(csv_dir / 'race_control_messages.csv')
+            self.lap_data = _downcast_columns(_read_csv_columns(csv_dir / 'lap_data.csv', LAP_COLUMNS), LAP_DTYPES)
+            self.race_control = _read_csv_columns(csv_dir / 'race_control_messages.csv', RACE_CONTROL_COLUMNS)
             self.track_status = pd.read_csv(csv_dir / 'track_status.csv')
             self.session_results = pd.read_csv(csv_dir / 'session_results.csv')
             self.weather_data = pd.read_csv(csv_dir / 'weather_data.csv')
             self.session_status = pd.read_csv(csv_dir / 'session_status.csv')
             
+            # Arrow-backed strings run the message scans on Arrow's string kernels
+            self.race_control['Message'] = self.race_control['Message'].astype('string[pyarrow]')
+            
+            self.race_name = race_name
+            self._session = None
+            self._telemetry_stats = None
+            # Results collected for a previous race must not leak into this one
+            self.analysis_results = {}
+            
             print(f"Successfully loaded data for {race_name}")
             print(f"  - {len(self.lap_data)} lap records")
             print(f"  - {len(self.race_control)} race control messages")
@@ -113,6 +362,7 @@ class F1RaceAnalyzer:
             ] if not self.session_results.empty else []
         }
     
+    @_memoize_analysis
     def analyze_incidents(self) -> List[Dict]:
         """Analyze all incidents and collisions with detailed telemetry data."""
         if self.race_control is None or self.lap_data is None:
@@ -121,19 +371,11 @@ class F1RaceAnalyzer:
         incidents = []
         
         # Find incident-related messages
-        incident_keywords = ['INCIDENT', 'CRASH', 'COLLISION', 'OFF TRACK', 'SPIN', 'CONTACT']
-        incident_messages = self.race_control[
-            self.race_control['Message'].str.contains('|'.join(incident_keywords), case=False, na=False)
-        ]
+        incident_messages = self._find_messages('incident')
         
         for _, incident in incident_messages.iterrows():
             # Extract driver information from message
-            drivers = []
-            if 'CAR' in incident['Message']:
-                # Extract car numbers from message
-                import re
-                car_numbers = re.findall(r'CAR (\d+)', incident['Message'])
-                drivers = car_numbers
+            drivers = list(_parse_message(incident['Message']).cars)
             
             incident_lap = int(incident['Lap']) if not pd.isna(incident['Lap']) else None
             
@@ -152,6 +394,46 @@ class F1RaceAnalyzer:
         
         return incidents
     
+    def _find_messages(self, category: str) -> pd.DataFrame:
+        """Return race control rows tagged with the given MESSAGE_CATEGORIES category."""
+        if self._message_masks_source is not self.race_control:
+            self._message_masks = self._categorize_messages()
+            self._message_masks_source = self.race_control
+        
+        return self.race_control[self._message_masks[category]]
+    
+    def _categorize_messages(self) -> Dict[str, np.ndarray]:
+        """
+        Tag race control messages with every category they belong to.
+        
+        The message column is scanned once for any category keyword (in a
+        single Aho-Corasick pass per message when pyahocorasick is installed,
+        otherwise with one case-insensitive regex over the column); only the
+        few matching messages are then checked against each category pattern.
+        """
+        messages = self.race_control['Message']
+        
+        if ahocorasick is not None:
+            automaton = _keyword_automaton()
+            candidates = np.fromiter(
+                (isinstance(message, str) and next(automaton.iter(message.upper()), None) is not None
+                 for message in messages),
+                dtype=bool, count=len(messages)
+            )
+        else:
+            candidates = messages.str.contains(_ANY_CATEGORY_PATTERN, case=False, na=False).to_numpy()
+        
+        # Confirm each category with its precompiled pattern, one vectorized
+        # scan over the candidate rows per category
+        rows = np.flatnonzero(candidates)
+        candidate_messages = messages.iloc[rows]
+        masks = {}
+        for category, (pattern, _) in MESSAGE_CATEGORIES.items():
+            masks[category] = np.zeros(len(messages), dtype=bool)
+            masks[category][rows] = candidate_messages.str.contains(pattern, na=False).to_numpy()
+        
+        return masks
+    
     def _get_steward_action(self, message: str) -> str:
         """Extract steward action from message."""
         if 'NO FURTHER ACTION' in message:
@@ -181,119 +463,210 @@ class F1RaceAnalyzer:
                 continue
             
             # Get laps around the incident (2 laps before, incident lap, 2 laps after)
-            analysis_laps = [incident_lap - 2, incident_lap - 1, incident_lap, incident_lap + 1, incident_lap + 2]
-            driver_telemetry = {}
+            first_lap = incident_lap - INCIDENT_WINDOW_BEFORE
+            analysis_laps = range(first_lap, first_lap + INCIDENT_WINDOW_SIZE)
+            window = [None] * INCIDENT_WINDOW_SIZE
             
-            for lap_num in analysis_laps:
+            for offset, lap_num in enumerate(analysis_laps):
                 if lap_num <= 0:
                     continue
                     
-                lap_data = self.lap_data[
-                    (self.lap_data['Driver'] == driver_abbrev) & 
-                    (self.lap_data['LapNumber'] == lap_num)
-                ]
+                snapshot = self._get_driver_lap_snapshot(driver_abbrev, lap_num)
                 
-                if not lap_data.empty:
-                    lap_info = lap_data.iloc[0]
+                if snapshot is not None:
                     
                     # Extract telemetry data
-                    telemetry_data = {
-                        'lap_number': int(lap_num),
-                        'lap_time': str(lap_info.get('LapTime', 'N/A')),
-                        'position': int(lap_info.get('Position', 0)) if not pd.isna(lap_info.get('Position')) else None,
-                        'sector1_time': str(lap_info.get('Sector1Time', 'N/A')),
-                        'sector2_time': str(lap_info.get('Sector2Time', 'N/A')),
-                        'sector3_time': str(lap_info.get('Sector3Time', 'N/A')),
-                        'speed_i1': float(lap_info.get('SpeedI1', 0)) if not pd.isna(lap_info.get('SpeedI1')) else None,
-                        'speed_i2': float(lap_info.get('SpeedI2', 0)) if not pd.isna(lap_info.get('SpeedI2')) else None,
-                        'speed_fl': float(lap_info.get('SpeedFL', 0)) if not pd.isna(lap_info.get('SpeedFL')) else None,
-                        'speed_st': float(lap_info.get('SpeedST', 0)) if not pd.isna(lap_info.get('SpeedST')) else None,
-                        'compound': lap_info.get('Compound', 'Unknown'),
-                        'tyre_life': int(lap_info.get('TyreLife', 0)) if not pd.isna(lap_info.get('TyreLife')) else None,
-                        'is_personal_best': bool(lap_info.get('IsPersonalBest', False)),
-                        'track_status': int(lap_info.get('TrackStatus', 1)) if not pd.isna(lap_info.get('TrackStatus')) else 1
-                    }
+                    telemetry_data = dict(snapshot)
+                    track_status = self._get_lap_row(driver_abbrev, lap_num).get('TrackStatus')
+                    telemetry_data['track_status'] = int(track_status) if not pd.isna(track_status) else 1
                     
                     # Add detailed car telemetry data if available
                     car_telemetry = self._get_car_telemetry_data(driver_abbrev, lap_num)
                     if car_telemetry:
                         telemetry_data.update(car_telemetry)
                     
-                    driver_telemetry[f'lap_{lap_num}'] = telemetry_data
+                    window[offset] = telemetry_data
             
             # Analyze patterns and changes
-            if driver_telemetry:
-                analysis = self._analyze_telemetry_patterns(driver_telemetry, incident_lap)
+            if any(window):
+                analysis = self._analyze_telemetry_patterns(window)
                 telemetry_analysis[driver_abbrev] = {
                     'driver_number': driver_num,
-                    'lap_data': driver_telemetry,
+                    'lap_data': {f"lap_{lap['lap_number']}": lap for lap in window if lap},
                     'analysis': analysis
                 }
         
         return telemetry_analysis
     
+    def _get_ordered_laps(self) -> pd.DataFrame:
+        """
+        Get lap_data ordered by driver (in order of first appearance), then
+        lap number. Sorted once and shared until lap_data is replaced.
+        """
+        if self._ordered_laps_source is not self.lap_data:
+            driver_codes = pd.factorize(self.lap_data['Driver'])[0]
+            order = np.lexsort((self.lap_data['LapNumber'].to_numpy(), driver_codes))
+            self._ordered_laps = self.lap_data.iloc[order].reset_index(drop=True)
+            self._ordered_laps_source = self.lap_data
+        return self._ordered_laps
+    
+    def _get_lap_row(self, driver: str, lap_number: int) -> Optional[pd.Series]:
+        """Look up a driver's lap in lap_data by (driver, lap number) without scanning the frame."""
+        if self._lap_index_source is not self.lap_data:
+            # (Re)build the index whenever lap_data has been replaced
+            index = {}
+            keys = zip(self.lap_data['Driver'].to_numpy(), self.lap_data['LapNumber'].to_numpy())
+            for row, key in enumerate(keys):
+                index.setdefault(key, row)
+            self._lap_index = index
+            self._lap_index_source = self.lap_data
+        
+        row = self._lap_index.get((driver, lap_number))
+        return self.lap_data.iloc[row] if row is not None else None
+    
+    def _get_driver_lap_snapshot(self, driver: str, lap_number: int) -> Optional[Dict]:
+        """Get the cached per-lap summary shared by the incident and violation analyses."""
+        if self._snapshot_source is not self.lap_data:
+            # Snapshots describe one lap_data frame; drop them when it is replaced
+            self._driver_lap_snapshot.cache_clear()
+            self._snapshot_source = self.lap_data
+        
+        return self._driver_lap_snapshot(driver, lap_number)
+    
+    def _driver_lap_snapshot_impl(self, driver: str, lap_number: int) -> Optional[Dict]:
+        """Summarize one lap of lap_data for a driver (callers must copy before modifying)."""
+        lap_info = self._get_lap_row(driver, lap_number)
+        if lap_info is None:
+            return None
+        
+        return {
+            'lap_number': int(lap_number),
+            'lap_time': str(lap_info.get('LapTime', 'N/A')),
+            'position': int(lap_info.get('Position', 0)) if not pd.isna(lap_info.get('Position')) else None,
+            'sector1_time': str(lap_info.get('Sector1Time', 'N/A')),
+            'sector2_time': str(lap_info.get('Sector2Time', 'N/A')),
+            'sector3_time': str(lap_info.get('Sector3Time', 'N/A')),
+            'speed_i1': float(lap_info.get('SpeedI1', 0)) if not pd.isna(lap_info.get('SpeedI1')) else None,
+            'speed_i2': float(lap_info.get('SpeedI2', 0)) if not pd.isna(lap_info.get('SpeedI2')) else None,
+            'speed_fl': float(lap_info.get('SpeedFL', 0)) if not pd.isna(lap_info.get('SpeedFL')) else None,
+            'speed_st': float(lap_info.get('SpeedST', 0)) if not pd.isna(lap_info.get('SpeedST')) else None,
+            'compound': lap_info.get('Compound', 'Unknown'),
+            'tyre_life': int(lap_info.get('TyreLife', 0)) if not pd.isna(lap_info.get('TyreLife')) else None,
+            'is_personal_best': bool(lap_info.get('IsPersonalBest', False))
+        }
+    
     def _get_driver_from_car_number(self, car_number: str) -> Optional[str]:
         """Get driver abbreviation from car number."""
         if self.session_results is None:
             return None
         
-        driver_row = self.session_results[self.session_results['DriverNumber'] == int(car_number)]
-        if not driver_row.empty:
-            return driver_row.iloc[0]['Abbreviation']
-        return None
+        if self._car_numbers_source is not self.session_results:
+            # Map car numbers to abbreviations once per results frame
+            car_numbers = {}
+            for number, abbreviation in zip(self.session_results['DriverNumber'].to_numpy(),
+                                            self.session_results['Abbreviation'].to_numpy()):
+                car_numbers.setdefault(number, abbreviation)
+            self._car_numbers = car_numbers
+            self._car_numbers_source = self.session_results
+        
+        return self._car_numbers.get(int(car_number))
     
-    def _get_car_telemetry_data(self, driver_abbrev: str, lap_num: int) -> Optional[Dict]:
-        """Get detailed car telemetry data for a specific driver and lap."""
-        try:
-            import fastf1
-            fastf1.Cache.enable_cache('./f1_cache')
-            
-            # Load session data
-            session = fastf1.get_session(2024, 'Hungarian Grand Prix', 'R')
-            session.load()
-            
-            # Get driver laps
-            laps = session.laps
-            driver_laps = laps.pick_driver(driver_abbrev)
-            
-            if driver_laps.empty:
+    def _get_session(self):
+        """Load the FastF1 session for this race once and reuse it (None if it can't be loaded)."""
+        if self._session is None:
+            try:
+                import fastf1
+                fastf1.Cache.enable_cache('./f1_cache')
+                
+                session = fastf1.get_session(self.year, self.race_name or 'Hungarian Grand Prix', 'R')
+                session.load()
+                self._session = session
+            except Exception as e:
+                print(f"Error loading FastF1 session for car telemetry: {e}")
+                # Don't retry for every lap
+                self._session = False
+        return self._session if self._session is not False else None
+    
+    def _get_telemetry_stats(self) -> Optional[pd.DataFrame]:
+        """
+        Get per-lap car telemetry statistics for every driver, indexed by
+        (Driver, LapNumber).
+        
+        Each car data sample is assigned to the lap whose LapStartTime..Time
+        window contains it (the window Lap.get_car_data slices), and all laps
+        are then reduced in one groupby aggregation. Computed once.
+        """
+        if self._telemetry_stats is None:
+            session = self._get_session()
+            self._telemetry_stats = False
+            if session is None:
                 return None
             
-            # Get the specific lap
-            lap_data = driver_laps[driver_laps['LapNumber'] == lap_num]
-            if lap_data.empty:
+            samples = []
+            lap_windows = session.laps[['Driver', 'DriverNumber', 'LapNumber', 'LapStartTime', 'Time']]
+            lap_windows = lap_windows.dropna(subset=['LapStartTime', 'Time'])
+            for number, windows in lap_windows.groupby('DriverNumber', sort=False):
+                car_data = session.car_data.get(number)
+                if car_data is None or car_data.empty:
+                    continue
+                car_data = pd.DataFrame(car_data[TELEMETRY_COLUMNS]).sort_values('SessionTime')
+                driver_samples = pd.merge_asof(
+                    car_data, pd.DataFrame(windows).sort_values('LapStartTime'),
+                    left_on='SessionTime', right_on='LapStartTime', direction='backward'
+                )
+                samples.append(driver_samples[driver_samples['SessionTime'] <= driver_samples['Time']])
+            
+            if not samples:
                 return None
             
-            # Get car telemetry for this lap
-            telemetry = lap_data.get_car_data()
+            samples = pd.concat(samples, ignore_index=True)
+            samples['gear_change'] = samples.groupby(['Driver', 'LapNumber'], sort=False)['nGear'].diff() != 0
+            samples['brake_lock'] = samples['Brake'] > 0.8
+            samples['throttle_on'] = samples['Throttle'] > 0.5
             
-            if telemetry.empty:
+            stats = samples.groupby(['Driver', 'LapNumber'], sort=False).agg(
+                avg_rpm=('RPM', 'mean'), max_rpm=('RPM', 'max'),
+                avg_throttle=('Throttle', 'mean'), max_throttle=('Throttle', 'max'),
+                avg_brake=('Brake', 'mean'), max_brake=('Brake', 'max'),
+                avg_speed=('Speed', 'mean'), max_speed=('Speed', 'max'),
+                gear_changes=('gear_change', 'sum'), drs_usage=('DRS', 'mean'),
+                brake_lock_events=('brake_lock', 'sum'), throttle_application=('throttle_on', 'mean'),
+                gear_samples=('nGear', 'count'), brake_samples=('Brake', 'count'),
+                throttle_samples=('Throttle', 'count')
+            )
+            # Counts taken over a channel with no data at all are reported as missing
+            stats['gear_changes'] = stats['gear_changes'].where(stats.pop('gear_samples') > 0)
+            stats['brake_lock_events'] = stats['brake_lock_events'].where(stats.pop('brake_samples') > 0)
+            stats['throttle_application'] = stats['throttle_application'].where(stats.pop('throttle_samples') > 0)
+            self._telemetry_stats = stats.astype(float)
+        
+        return self._telemetry_stats if self._telemetry_stats is not False else None
+    
+    def _get_car_telemetry_data(self, driver_abbrev: str, lap_num: int) -> Optional[Dict]:
+        """Get detailed car telemetry data for a specific driver and lap."""
+        try:
+            stats = self._get_telemetry_stats()
+            if stats is None or (driver_abbrev, lap_num) not in stats.index:
                 return None
             
-            # Calculate statistics for the lap
-            telemetry_stats = {
-                'avg_rpm': float(telemetry['RPM'].mean()) if not telemetry['RPM'].isna().all() else None,
-                'max_rpm': float(telemetry['RPM'].max()) if not telemetry['RPM'].isna().all() else None,
-                'avg_throttle': float(telemetry['Throttle'].mean()) if not telemetry['Throttle'].isna().all() else None,
-                'max_throttle': float(telemetry['Throttle'].max()) if not telemetry['Throttle'].isna().all() else None,
-                'avg_brake': float(telemetry['Brake'].mean()) if not telemetry['Brake'].isna().all() else None,
-                'max_brake': float(telemetry['Brake'].max()) if not telemetry['Brake'].isna().all() else None,
-                'avg_speed': float(telemetry['Speed'].mean()) if not telemetry['Speed'].isna().all() else None,
-                'max_speed': float(telemetry['Speed'].max()) if not telemetry['Speed'].isna().all() else None,
-                'gear_changes': int((telemetry['nGear'].diff() != 0).sum()) if not telemetry['nGear'].isna().all() else None,
-                'drs_usage': float(telemetry['DRS'].mean()) if not telemetry['DRS'].isna().all() else None,
-                'brake_lock_events': int((telemetry['Brake'] > 0.8).sum()) if not telemetry['Brake'].isna().all() else None,
-                'throttle_application': float((telemetry['Throttle'] > 0.5).mean()) if not telemetry['Throttle'].isna().all() else None
+            lap_stats = stats.loc[(driver_abbrev, lap_num)]
+            return {
+                name: (int(value) if name in ('gear_changes', 'brake_lock_events') else float(value))
+                if not pd.isna(value) else None
+                for name, value in lap_stats.items()
             }
             
-            return telemetry_stats
-            
         except Exception as e:
             print(f"Error getting car telemetry for {driver_abbrev} lap {lap_num}: {e}")
             return None
     
-    def _analyze_telemetry_patterns(self, telemetry_data: Dict, incident_lap: int) -> Dict:
-        """Analyze telemetry patterns around incidents."""
+    def _analyze_telemetry_patterns(self, window: List[Optional[Dict]]) -> Dict:
+        """
+        Analyze telemetry patterns around incidents.
+        
+        window holds one lap dict per lap offset (None for missing laps), with
+        the incident lap at INCIDENT_WINDOW_BEFORE.
+        """
         analysis = {
             'speed_analysis': {},
             'sector_analysis': {},
@@ -302,132 +675,161 @@ class F1RaceAnalyzer:
             'anomalies': []
         }
         
-        # Speed analysis
-        speeds = {}
-        for lap_key, data in telemetry_data.items():
-            if data['speed_fl'] is not None:
-                speeds[lap_key] = data['speed_fl']
+        speeds = np.array([np.nan if lap is None or lap['speed_fl'] is None else lap['speed_fl'] for lap in window])
+        positions = np.array([np.nan if lap is None or lap['position'] is None else lap['position'] for lap in window])
         
-        if len(speeds) >= 2:
-            speed_values = list(speeds.values())
+        # Speed analysis
+        count, min_speed, max_speed, incident_speed, speed_change = _window_stats(speeds, INCIDENT_WINDOW_BEFORE)
+        if count >= 2:
             analysis['speed_analysis'] = {
-                'max_speed': max(speed_values),
-                'min_speed': min(speed_values),
-                'speed_variance': max(speed_values) - min(speed_values),
-                'incident_lap_speed': speeds.get(f'lap_{incident_lap}', None)
+                'max_speed': float(max_speed),
+                'min_speed': float(min_speed),
+                'speed_variance': float(max_speed - min_speed),
+                'incident_lap_speed': None if np.isnan(incident_speed) else float(incident_speed)
             }
             
             # Check for significant speed drops
-            if f'lap_{incident_lap}' in speeds and f'lap_{incident_lap-1}' in speeds:
-                speed_drop = speeds[f'lap_{incident_lap-1}'] - speeds[f'lap_{incident_lap}']
-                if speed_drop > 20:  # Significant speed drop
-                    analysis['anomalies'].append(f"Significant speed drop: {speed_drop:.1f} km/h")
+            speed_drop = -speed_change
+            if speed_drop > 20:  # Significant speed drop
+                analysis['anomalies'].append(f"Significant speed drop: {speed_drop:.1f} km/h")
         
         # Sector time analysis
-        sector_times = {}
-        for lap_key, data in telemetry_data.items():
-            if data['sector1_time'] != 'N/A':
-                sector_times[lap_key] = {
-                    'sector1': data['sector1_time'],
-                    'sector2': data['sector2_time'],
-                    'sector3': data['sector3_time']
-                }
+        sector_times = [
+            {
+                'sector1': lap['sector1_time'],
+                'sector2': lap['sector2_time'],
+                'sector3': lap['sector3_time']
+            } if lap is not None and lap['sector1_time'] != 'N/A' else None
+            for lap in window
+        ]
+        laps_with_sectors = [times for times in sector_times if times]
         
-        if len(sector_times) >= 2:
+        if len(laps_with_sectors) >= 2:
             # Find slowest sectors
             slowest_sectors = {}
             for sector in ['sector1', 'sector2', 'sector3']:
-                sector_values = [data[sector] for data in sector_times.values() if data[sector] != 'N/A']
+                sector_values = [times[sector] for times in laps_with_sectors if times[sector] != 'N/A']
                 if sector_values:
                     slowest_sectors[sector] = max(sector_values)
             
             analysis['sector_analysis'] = {
                 'slowest_sectors': slowest_sectors,
-                'incident_lap_sectors': sector_times.get(f'lap_{incident_lap}', {})
+                'incident_lap_sectors': sector_times[INCIDENT_WINDOW_BEFORE] or {}
             }
         
         # Position analysis
-        positions = {}
-        for lap_key, data in telemetry_data.items():
-            if data['position'] is not None:
-                positions[lap_key] = data['position']
-        
-        if len(positions) >= 2:
-            position_values = list(positions.values())
+        count, min_position, max_position, incident_position, position_drop = _window_stats(
+            positions, INCIDENT_WINDOW_BEFORE
+        )
+        if count >= 2:
             analysis['position_analysis'] = {
-                'position_range': f"{min(position_values)} - {max(position_values)}",
-                'position_change': max(position_values) - min(position_values),
-                'incident_lap_position': positions.get(f'lap_{incident_lap}', None)
+                'position_range': f"{int(min_position)} - {int(max_position)}",
+                'position_change': int(max_position - min_position),
+                'incident_lap_position': None if np.isnan(incident_position) else int(incident_position)
             }
             
             # Check for position drops
-            if f'lap_{incident_lap}' in positions and f'lap_{incident_lap-1}' in positions:
-                position_drop = positions[f'lap_{incident_lap}'] - positions[f'lap_{incident_lap-1}']
-                if position_drop > 0:  # Position got worse
-                    analysis['anomalies'].append(f"Position drop: {position_drop} positions")
+            if position_drop > 0:  # Position got worse
+                analysis['anomalies'].append(f"Position drop: {int(position_drop)} positions")
         
         # Tire analysis
-        tire_data = {}
-        for lap_key, data in telemetry_data.items():
-            if data['compound'] != 'Unknown':
-                tire_data[lap_key] = {
-                    'compound': data['compound'],
-                    'tyre_life': data['tyre_life']
-                }
+        tire_data = [
+            {'compound': lap['compound'], 'tyre_life': lap['tyre_life']}
+            if lap is not None and lap['compound'] != 'Unknown' else None
+            for lap in window
+        ]
         
-        if tire_data:
+        if any(tire_data):
+            incident_tire = tire_data[INCIDENT_WINDOW_BEFORE] or {}
             analysis['tire_analysis'] = {
-                'compounds_used': list(set([data['compound'] for data in tire_data.values()])),
-                'incident_lap_tire': tire_data.get(f'lap_{incident_lap}', {}),
-                'tire_age_at_incident': tire_data.get(f'lap_{incident_lap}', {}).get('tyre_life', None)
+                'compounds_used': list(set([tire['compound'] for tire in tire_data if tire])),
+                'incident_lap_tire': incident_tire,
+                'tire_age_at_incident': incident_tire.get('tyre_life', None)
             }
         
         return analysis
     
+    @_memoize_analysis
     def analyze_position_changes(self, min_change: int = 3) -> List[Dict]:
         """Analyze significant position changes with telemetry data."""
+        return list(self.iter_position_changes(min_change=min_change))
+    
+    def iter_position_changes(self, min_change: int = 3) -> Iterator[Dict]:
+        """
+        Yield significant position changes, biggest changes first.
+        
+        Telemetry comparisons are only computed as each change is yielded, so
+        callers that need just the top few changes can stop early.
+        """
+        for driver, prev_lap, curr_lap, change in self._find_position_changes(min_change):
+            yield {
+                'driver': driver,
+                'lap': int(curr_lap['LapNumber']),
+                'from_position': int(prev_lap['Position']),
+                'to_position': int(curr_lap['Position']),
+                'change': int(change),
+                'lap_time': str(curr_lap['LapTime']),
+                'prev_lap_time': str(prev_lap['LapTime']),
+                'compound': curr_lap.get('Compound', 'Unknown'),
+                'tyre_life': int(curr_lap.get('TyreLife', 0)) if not pd.isna(curr_lap.get('TyreLife')) else None,
+                'telemetry_comparison': self._compare_lap_telemetry(prev_lap, curr_lap)
+            }
+    
+    def count_position_changes(self, min_change: int = 3) -> int:
+        """Count significant position changes without building telemetry comparisons."""
+        return len(self._find_position_changes(min_change))
+    
+    def _find_position_changes(self, min_change: int) -> List[PositionChange]:
+        """Find position changes of at least min_change places, sorted by absolute change."""
         if self.lap_data is None:
             return []
         
-        position_changes = []
+        laps, changes, magnitudes = self._get_position_changes()
+        
+        # Magnitudes are sorted biggest first, so the matches are a prefix
+        count = int(np.searchsorted(-magnitudes, -min_change, side='right'))
+        return [PositionChange(laps.at[i, 'Driver'], laps.iloc[i - 1], laps.iloc[i], change)
+                for i, change in changes.iloc[:count].items()]
+    
+    def _get_position_changes(self) -> Tuple[pd.DataFrame, pd.Series, np.ndarray]:
+        """
+        Get every lap-on-lap position change, computed once per lap_data frame.
         
-        for driver in self.lap_data['Driver'].unique():
-            driver_laps = self.lap_data[self.lap_data['Driver'] == driver].sort_values('LapNumber')
+        Returns the ordered laps (with *Diff columns), the non-zero changes
+        indexed by lap row and sorted by absolute change (biggest first,
+        keeping lap order for ties), and the matching absolute changes as an
+        array so callers can filter by magnitude with a comparison.
+        """
+        if self._position_changes_source is not self.lap_data:
+            # Compare each lap with the driver's previous one in a single pass. The
+            # shallow copy keeps the *Diff columns below out of the shared frame.
+            laps = self._get_ordered_laps().copy(deep=False)
             
-            if len(driver_laps) > 1:
-                for i in range(1, len(driver_laps)):
-                    prev_lap = driver_laps.iloc[i-1]
-                    curr_lap = driver_laps.iloc[i]
-                    
-                    prev_pos = prev_lap['Position']
-                    curr_pos = curr_lap['Position']
-                    
-                    if not pd.isna(prev_pos) and not pd.isna(curr_pos) and prev_pos != curr_pos:
-                        change = prev_pos - curr_pos
-                        
-                        if abs(change) >= min_change:
-                            # Get telemetry comparison
-                            telemetry_comparison = self._compare_lap_telemetry(prev_lap, curr_lap)
-                            
-                            position_changes.append({
-                                'driver': driver,
-                                'lap': int(curr_lap['LapNumber']),
-                                'from_position': int(prev_pos),
-                                'to_position': int(curr_pos),
-                                'change': int(change),
-                                'lap_time': str(curr_lap['LapTime']),
-                                'prev_lap_time': str(prev_lap['LapTime']),
-                                'compound': curr_lap.get('Compound', 'Unknown'),
-                                'tyre_life': int(curr_lap.get('TyreLife', 0)) if not pd.isna(curr_lap.get('TyreLife')) else None,
-                                'telemetry_comparison': telemetry_comparison
-                            })
-        
-        # Sort by absolute change (biggest changes first)
-        position_changes.sort(key=lambda x: abs(x['change']), reverse=True)
-        return position_changes
+            change = laps.groupby('Driver', sort=False)['Position'].shift() - laps['Position']
+            magnitude = change.abs().to_numpy(dtype=float, na_value=np.nan)
+            nonzero = magnitude > 0
+            change, magnitude = change[nonzero], magnitude[nonzero]
+            
+            # Lap and sector time differences for _compare_lap_telemetry, parsed
+            # in one vectorized pass rather than per compared lap
+            for field in ('LapTime', 'Sector1Time', 'Sector2Time', 'Sector3Time'):
+                if field in laps:
+                    seconds = pd.to_timedelta(laps[field], errors='coerce').dt.total_seconds()
+                    laps[f'{field}Diff'] = seconds.groupby(laps['Driver'], sort=False).diff()
+            
+            order = np.argsort(-magnitude, kind='stable')
+            self._position_changes = (laps, change.iloc[order], magnitude[order])
+            self._position_changes_source = self.lap_data
+        
+        return self._position_changes
     
     def _compare_lap_telemetry(self, prev_lap: pd.Series, curr_lap: pd.Series) -> Dict:
-        """Compare telemetry data between two laps."""
+        """
+        Compare telemetry data between two consecutive laps.
+        
+        Lap and sector time differences are read from the *Diff columns that
+        _find_position_changes adds to curr_lap.
+        """
         comparison = {
             'lap_time_change': 'N/A',
             'speed_changes': {},
@@ -436,17 +838,13 @@ class F1RaceAnalyzer:
             'anomalies': []
         }
         
-        # Lap time comparison
-        try:
-            prev_time = pd.to_timedelta(prev_lap['LapTime']).total_seconds()
-            curr_time = pd.to_timedelta(curr_lap['LapTime']).total_seconds()
-            time_diff = curr_time - prev_time
+        # Lap time comparison (differences precomputed by _find_position_changes)
+        time_diff = curr_lap.get('LapTimeDiff')
+        if time_diff is not None:
             comparison['lap_time_change'] = f"{time_diff:+.3f}s"
             
             if abs(time_diff) > 2.0:  # Significant lap time change
                 comparison['anomalies'].append(f"Significant lap time change: {time_diff:+.3f}s")
-        except:
-            pass
         
         # Speed comparison
         speed_fields = ['SpeedI1', 'SpeedI2', 'SpeedFL', 'SpeedST']
@@ -461,17 +859,12 @@ class F1RaceAnalyzer:
         # Sector time comparison
         sector_fields = ['Sector1Time', 'Sector2Time', 'Sector3Time']
         for field in sector_fields:
-            if not pd.isna(prev_lap.get(field)) and not pd.isna(curr_lap.get(field)):
-                try:
-                    prev_sector = pd.to_timedelta(prev_lap[field]).total_seconds()
-                    curr_sector = pd.to_timedelta(curr_lap[field]).total_seconds()
-                    sector_diff = curr_sector - prev_sector
-                    comparison['sector_changes'][field] = f"{sector_diff:+.3f}s"
-                    
-                    if abs(sector_diff) > 0.5:  # Significant sector change
-                        comparison['anomalies'].append(f"Significant {field} change: {sector_diff:+.3f}s")
-                except:
-                    pass
+            sector_diff = curr_lap.get(f'{field}Diff')
+            if not pd.isna(sector_diff):
+                comparison['sector_changes'][field] = f"{sector_diff:+.3f}s"
+                
+                if abs(sector_diff) > 0.5:  # Significant sector change
+                    comparison['anomalies'].append(f"Significant {field} change: {sector_diff:+.3f}s")
         
         # Tire comparison
         if prev_lap.get('Compound') != curr_lap.get('Compound'):
@@ -485,44 +878,45 @@ class F1RaceAnalyzer:
         
         return comparison
     
+    @_memoize_analysis
     def analyze_pit_stop_strategies(self) -> Dict:
         """Analyze pit stop strategies for all drivers."""
         if self.lap_data is None:
             return {}
         
-        strategies = {}
+        laps = self._get_ordered_laps()
+        pits = laps[laps['PitInTime'].notna() & laps['Driver'].notna()]
+        if pits.empty:
+            return {}
+        
+        # Positions on the laps either side of each stop, joined in one go
+        positions = laps.drop_duplicates(['Driver', 'LapNumber'])[['Driver', 'LapNumber', 'Position']]
+        keys = pits[['Driver', 'LapNumber']]
+        pos_before = keys.assign(LapNumber=keys['LapNumber'] - 1).merge(
+            positions, how='left', on=['Driver', 'LapNumber'])['Position'].to_numpy()
+        pos_after = keys.assign(LapNumber=keys['LapNumber'] + 1).merge(
+            positions, how='left', on=['Driver', 'LapNumber'])['Position'].to_numpy()
+        last_lap = pits['Driver'].map(laps.groupby('Driver')['LapNumber'].max()).to_numpy()
         
-        for driver in self.lap_data['Driver'].unique():
-            driver_laps = self.lap_data[self.lap_data['Driver'] == driver].sort_values('LapNumber')
-            pit_stops = driver_laps[driver_laps['PitInTime'].notna()]
+        strategies = {}
+        columns = pits.reindex(columns=['Driver', 'LapNumber', 'Compound', 'TyreLife'], fill_value='Unknown')
+        for (driver, lap_num, compound, tyre_life), before, after, last in zip(
+                columns.itertuples(index=False, name=None), pos_before, pos_after, last_lap):
+            before = before if lap_num > 1 and not pd.isna(before) else None
+            after = after if lap_num < last and not pd.isna(after) else None
             
-            if not pit_stops.empty:
-                driver_strategy = []
-                for _, pit in pit_stops.iterrows():
-                    lap_num = pit['LapNumber']
-                    
-                    # Get position before and after pit stop
-                    pos_before = None
-                    pos_after = None
-                    
-                    if lap_num > 1:
-                        pos_before = driver_laps[driver_laps['LapNumber'] == lap_num - 1]['Position'].iloc[0]
-                    if lap_num < driver_laps['LapNumber'].max():
-                        pos_after = driver_laps[driver_laps['LapNumber'] == lap_num + 1]['Position'].iloc[0]
-                    
-                    driver_strategy.append({
-                        'lap': int(lap_num),
-                        'compound': pit.get('Compound', 'Unknown'),
-                        'tyre_life': pit.get('TyreLife', 'Unknown'),
-                        'position_before': int(pos_before) if pos_before else None,
-                        'position_after': int(pos_after) if pos_after else None,
-                        'position_change': int(pos_after - pos_before) if pos_before and pos_after else None
-                    })
-                
-                strategies[driver] = driver_strategy
+            strategies.setdefault(driver, []).append({
+                'lap': int(lap_num),
+                'compound': compound,
+                'tyre_life': tyre_life,
+                'position_before': int(before) if before else None,
+                'position_after': int(after) if after else None,
+                'position_change': int(after - before) if before and after else None
+            })
         
         return strategies
     
+    @_memoize_analysis
     def analyze_track_limits_violations(self) -> List[Dict]:
         """Analyze track limits violations with telemetry data."""
         if self.race_control is None:
@@ -531,34 +925,28 @@ class F1RaceAnalyzer:
         violations = []
         
         # Find track limits messages
-        track_limits_messages = self.race_control[
-            self.race_control['Message'].str.contains('TRACK LIMITS|DELETED', case=False, na=False)
-        ]
+        track_limits_messages = self._find_messages('track_limits')
         
         for _, violation in track_limits_messages.iterrows():
             # Extract driver and details from message
-            import re
-            driver_match = re.search(r'CAR (\d+)', violation['Message'])
-            time_match = re.search(r'TIME ([0-9:\.]+)', violation['Message'])
-            turn_match = re.search(r'TURN (\d+)', violation['Message'])
+            cars, deleted_time, turn = _parse_message(violation['Message'])
             
             violation_lap = int(violation['Lap']) if not pd.isna(violation['Lap']) else None
-            driver_number = driver_match.group(1) if driver_match else None
+            driver_number = cars[0] if cars else None
             
             # Get telemetry analysis for this violation
+            driver_abbrev = self._get_driver_from_car_number(driver_number) if driver_number else None
             telemetry_analysis = {}
-            if violation_lap and driver_number:
-                driver_abbrev = self._get_driver_from_car_number(driver_number)
-                if driver_abbrev:
-                    telemetry_analysis = self._analyze_violation_telemetry(driver_abbrev, violation_lap)
+            if violation_lap and driver_abbrev:
+                telemetry_analysis = self._analyze_violation_telemetry(driver_abbrev, violation_lap)
             
             violations.append({
                 'lap': violation_lap,
                 'time': str(violation['Time']),
                 'driver_number': driver_number,
-                'driver_abbreviation': self._get_driver_from_car_number(driver_number) if driver_number else None,
-                'deleted_time': time_match.group(1) if time_match else None,
-                'turn': turn_match.group(1) if turn_match else None,
+                'driver_abbreviation': driver_abbrev,
+                'deleted_time': deleted_time,
+                'turn': turn,
                 'message': violation['Message'],
                 'telemetry_analysis': telemetry_analysis
             })
@@ -571,36 +959,18 @@ class F1RaceAnalyzer:
             return {}
         
         # Get laps around the violation (1 lap before, violation lap, 1 lap after)
-        analysis_laps = [violation_lap - 1, violation_lap, violation_lap + 1]
-        telemetry_data = {}
+        first_lap = violation_lap - VIOLATION_WINDOW_BEFORE
+        analysis_laps = range(first_lap, first_lap + VIOLATION_WINDOW_SIZE)
+        window = [None] * VIOLATION_WINDOW_SIZE
         
-        for lap_num in analysis_laps:
+        for offset, lap_num in enumerate(analysis_laps):
             if lap_num <= 0:
                 continue
                 
-            lap_data = self.lap_data[
-                (self.lap_data['Driver'] == driver_abbrev) & 
-                (self.lap_data['LapNumber'] == lap_num)
-            ]
+            snapshot = self._get_driver_lap_snapshot(driver_abbrev, lap_num)
             
-            if not lap_data.empty:
-                lap_info = lap_data.iloc[0]
-                
-                telemetry_data[f'lap_{lap_num}'] = {
-                    'lap_number': int(lap_num),
-                    'lap_time': str(lap_info.get('LapTime', 'N/A')),
-                    'position': int(lap_info.get('Position', 0)) if not pd.isna(lap_info.get('Position')) else None,
-                    'sector1_time': str(lap_info.get('Sector1Time', 'N/A')),
-                    'sector2_time': str(lap_info.get('Sector2Time', 'N/A')),
-                    'sector3_time': str(lap_info.get('Sector3Time', 'N/A')),
-                    'speed_i1': float(lap_info.get('SpeedI1', 0)) if not pd.isna(lap_info.get('SpeedI1')) else None,
-                    'speed_i2': float(lap_info.get('SpeedI2', 0)) if not pd.isna(lap_info.get('SpeedI2')) else None,
-                    'speed_fl': float(lap_info.get('SpeedFL', 0)) if not pd.isna(lap_info.get('SpeedFL')) else None,
-                    'speed_st': float(lap_info.get('SpeedST', 0)) if not pd.isna(lap_info.get('SpeedST')) else None,
-                    'compound': lap_info.get('Compound', 'Unknown'),
-                    'tyre_life': int(lap_info.get('TyreLife', 0)) if not pd.isna(lap_info.get('TyreLife')) else None,
-                    'is_personal_best': bool(lap_info.get('IsPersonalBest', False))
-                }
+            if snapshot is not None:
+                window[offset] = dict(snapshot)
         
         # Analyze patterns
         analysis = {
@@ -610,28 +980,22 @@ class F1RaceAnalyzer:
         }
         
         # Speed analysis
-        speeds = {}
-        for lap_key, data in telemetry_data.items():
-            if data['speed_fl'] is not None:
-                speeds[lap_key] = data['speed_fl']
-        
-        if len(speeds) >= 2:
-            speed_values = list(speeds.values())
+        speeds = np.array([np.nan if lap is None or lap['speed_fl'] is None else lap['speed_fl'] for lap in window])
+        count, min_speed, max_speed, violation_speed, speed_diff = _window_stats(speeds, VIOLATION_WINDOW_BEFORE)
+        if count >= 2:
             analysis['speed_analysis'] = {
-                'max_speed': max(speed_values),
-                'min_speed': min(speed_values),
-                'violation_lap_speed': speeds.get(f'lap_{violation_lap}', None)
+                'max_speed': float(max_speed),
+                'min_speed': float(min_speed),
+                'violation_lap_speed': None if np.isnan(violation_speed) else float(violation_speed)
             }
             
             # Check for speed anomalies
-            if f'lap_{violation_lap}' in speeds and f'lap_{violation_lap-1}' in speeds:
-                speed_diff = speeds[f'lap_{violation_lap}'] - speeds[f'lap_{violation_lap-1}']
-                if abs(speed_diff) > 10:
-                    analysis['anomalies'].append(f"Speed change: {speed_diff:+.1f} km/h")
+            if abs(speed_diff) > 10:
+                analysis['anomalies'].append(f"Speed change: {speed_diff:+.1f} km/h")
         
         # Sector analysis
-        if f'lap_{violation_lap}' in telemetry_data:
-            violation_lap_data = telemetry_data[f'lap_{violation_lap}']
+        violation_lap_data = window[VIOLATION_WINDOW_BEFORE]
+        if violation_lap_data is not None:
             analysis['sector_analysis'] = {
                 'sector1_time': violation_lap_data['sector1_time'],
                 'sector2_time': violation_lap_data['sector2_time'],
@@ -639,31 +1003,37 @@ class F1RaceAnalyzer:
             }
         
         return {
-            'lap_data': telemetry_data,
+            'lap_data': {f"lap_{lap['lap_number']}": lap for lap in window if lap},
             'analysis': analysis
         }
     
+    @_memoize_analysis
     def analyze_yellow_flags(self) -> List[Dict]:
         """Analyze yellow flag periods."""
         if self.race_control is None:
             return []
         
-        yellow_flags = []
-        
         # Find yellow flag messages
-        yellow_messages = self.race_control[
-            self.race_control['Message'].str.contains('YELLOW', case=False, na=False)
+        yellow_messages = self._find_messages('yellow')
+        
+        laps = yellow_messages['Lap'].to_numpy()
+        missing_laps = pd.isna(laps)
+        times = yellow_messages['Time'].astype(str).to_numpy()
+        messages = yellow_messages['Message'].to_numpy()
+        if 'Sector' in yellow_messages.columns:
+            sectors = yellow_messages['Sector'].to_numpy()
+        else:
+            sectors = [None] * len(yellow_messages)
+        
+        return [
+            {
+                'lap': None if missing else int(lap),
+                'time': time,
+                'message': message,
+                'sector': sector
+            }
+            for lap, missing, time, message, sector in zip(laps, missing_laps, times, messages, sectors)
         ]
-        
-        for _, flag in yellow_messages.iterrows():
-            yellow_flags.append({
-                'lap': int(flag['Lap']) if not pd.isna(flag['Lap']) else None,
-                'time': str(flag['Time']),
-                'message': flag['Message'],
-                'sector': flag.get('Sector', None)
-            })
-        
-        return yellow_flags
     
     def analyze_weather_impact(self) -> Dict:
         """Analyze weather conditions and their impact."""
@@ -673,39 +1043,8 @@ class F1RaceAnalyzer:
         if self.weather_data.empty:
             return {}
         
-        return {
-            'air_temperature': {
-                'min': float(self.weather_data['AirTemp'].min()),
-                'max': float(self.weather_data['AirTemp'].max()),
-                'avg': float(self.weather_data['AirTemp'].mean()),
-                'unit': 'Celsius'
-            },
-            'track_temperature': {
-                'min': float(self.weather_data['TrackTemp'].min()),
-                'max': float(self.weather_data['TrackTemp'].max()),
-                'avg': float(self.weather_data['TrackTemp'].mean()),
-                'unit': 'Celsius'
-            },
-            'humidity': {
-                'min': float(self.weather_data['Humidity'].min()),
-                'max': float(self.weather_data['Humidity'].max()),
-                'avg': float(self.weather_data['Humidity'].mean()),
-                'unit': 'percent'
-            },
-            'pressure': {
-                'min': float(self.weather_data['Pressure'].min()),
-                'max': float(self.weather_data['Pressure'].max()),
-                'avg': float(self.weather_data['Pressure'].mean()),
-                'unit': 'hPa'
-            },
-            'wind_speed': {
-                'min': float(self.weather_data['WindSpeed'].min()),
-                'max': float(self.weather_data['WindSpeed'].max()),
-                'avg': float(self.weather_data['WindSpeed'].mean()),
-                'unit': 'm/s'
-            },
-            'rainfall': 'Rain detected' if self.weather_data['Rainfall'].any() else 'No rain detected'
-        }
+        rainfall = 'Rain detected' if self.weather_data['Rainfall'].any() else 'No rain detected'
+        return _build_weather(_weather_stats(self.weather_data), rainfall)
     
     def identify_commentary_segments(self) -> List[Dict]:
         """Identify the most interesting segments for commentary."""
@@ -713,64 +1052,59 @@ class F1RaceAnalyzer:
         
         # Get all analysis data
         incidents = self.analyze_incidents()
-        position_changes = self.analyze_position_changes(min_change=5)  # Only major changes
+        position_changes = list(islice(self.iter_position_changes(min_change=5), 5))  # Top 5 major changes
         track_limits = self.analyze_track_limits_violations()
         yellow_flags = self.analyze_yellow_flags()
         
         # Priority 1: Major collisions
-        collisions = [inc for inc in incidents if 'COLLISION' in inc['message']]
-        for collision in collisions:
-            segments.append({
-                'priority': 1,
-                'type': 'collision',
-                'lap': collision['lap'],
-                'title': f"Collision - Lap {collision['lap']}",
-                'description': collision['message'],
-                'drivers': collision['drivers'],
-                'steward_action': collision['steward_action'],
-                'data_points': ['positions', 'lap_times', 'steward_investigation', 'yellow_flag']
-            })
+        segments.extend({
+            'priority': 1,
+            'type': 'collision',
+            'lap': collision['lap'],
+            'title': f"Collision - Lap {collision['lap']}",
+            'description': collision['message'],
+            'drivers': collision['drivers'],
+            'steward_action': collision['steward_action'],
+            'data_points': SEGMENT_DATA_POINTS['collision']
+        } for collision in incidents if 'COLLISION' in collision['message'])
         
         # Priority 2: Major position changes
-        for change in position_changes[:5]:  # Top 5 biggest changes
-            segments.append({
-                'priority': 2,
-                'type': 'position_change',
-                'lap': change['lap'],
-                'title': f"{change['driver']} - {change['change']:+d} positions (Lap {change['lap']})",
-                'description': f"{change['driver']} drops from {change['from_position']} to {change['to_position']}",
-                'driver': change['driver'],
-                'change': change['change'],
-                'data_points': ['position_change', 'lap_times', 'tire_compound']
-            })
+        segments.extend({
+            'priority': 2,
+            'type': 'position_change',
+            'lap': change['lap'],
+            'title': f"{change['driver']} - {change['change']:+d} positions (Lap {change['lap']})",
+            'description': f"{change['driver']} drops from {change['from_position']} to {change['to_position']}",
+            'driver': change['driver'],
+            'change': change['change'],
+            'data_points': SEGMENT_DATA_POINTS['position_change']
+        } for change in position_changes)
         
         # Priority 3: Track limits controversies
-        for violation in track_limits:
-            segments.append({
-                'priority': 3,
-                'type': 'track_limits',
-                'lap': violation['lap'],
-                'title': f"Track Limits - Lap {violation['lap']}",
-                'description': violation['message'],
-                'driver_number': violation['driver_number'],
-                'turn': violation['turn'],
-                'data_points': ['steward_decision', 'track_limits', 'racing_standards']
-            })
+        segments.extend({
+            'priority': 3,
+            'type': 'track_limits',
+            'lap': violation['lap'],
+            'title': f"Track Limits - Lap {violation['lap']}",
+            'description': violation['message'],
+            'driver_number': violation['driver_number'],
+            'turn': violation['turn'],
+            'data_points': SEGMENT_DATA_POINTS['track_limits']
+        } for violation in track_limits)
         
         # Priority 4: Yellow flag periods
-        for flag in yellow_flags:
-            segments.append({
-                'priority': 4,
-                'type': 'yellow_flag',
-                'lap': flag['lap'],
-                'title': f"Yellow Flag - Lap {flag['lap']}",
-                'description': flag['message'],
-                'sector': flag['sector'],
-                'data_points': ['track_status', 'safety_periods', 'race_impact']
-            })
+        segments.extend({
+            'priority': 4,
+            'type': 'yellow_flag',
+            'lap': flag['lap'],
+            'title': f"Yellow Flag - Lap {flag['lap']}",
+            'description': flag['message'],
+            'sector': flag['sector'],
+            'data_points': SEGMENT_DATA_POINTS['yellow_flag']
+        } for flag in yellow_flags)
         
         # Sort by priority
-        segments.sort(key=lambda x: x['priority'])
+        segments.sort(key=itemgetter('priority'))
         return segments
     
     def generate_comprehensive_analysis(self) -> Dict:
@@ -785,9 +1119,9 @@ class F1RaceAnalyzer:
             'track_limits_violations': self.analyze_track_limits_violations(),
             'yellow_flags': self.analyze_yellow_flags(),
             'weather_conditions': self.analyze_weather_impact(),
-            'commentary_segments': self.identify_commentary_segments(),
-            'statistics': self._generate_statistics()
+            'commentary_segments': self.identify_commentary_segments()
         }
+        self.analysis_results['statistics'] = self._generate_statistics()
         
         return self.analysis_results
     
@@ -796,17 +1130,28 @@ class F1RaceAnalyzer:
         if self.lap_data is None:
             return {}
         
-        # Count position changes
-        position_changes = self.analyze_position_changes(min_change=1)
+        # Reuse the results generate_comprehensive_analysis has already collected
+        results = self.analysis_results
+        incidents = results['incidents'] if 'incidents' in results else self.analyze_incidents()
+        track_limits = (results['track_limits_violations'] if 'track_limits_violations' in results
+                        else self.analyze_track_limits_violations())
+        yellow_flags = results['yellow_flags'] if 'yellow_flags' in results else self.analyze_yellow_flags()
+        pit_stops = (results['pit_stop_strategies'] if 'pit_stop_strategies' in results
+                     else self.analyze_pit_stop_strategies())
+        
+        # Count position changes from their magnitudes (no telemetry comparisons needed).
+        # Magnitudes are sorted biggest first, so each bucket is a prefix found by binary search.
+        magnitudes = self._get_position_changes()[2]
+        total, significant, major = np.searchsorted(-magnitudes, [-1, -3, -5], side='right').tolist()
         
         return {
-            'total_position_changes': len(position_changes),
-            'significant_changes_3plus': len([c for c in position_changes if abs(c['change']) >= 3]),
-            'major_changes_5plus': len([c for c in position_changes if abs(c['change']) >= 5]),
-            'total_incidents': len(self.analyze_incidents()),
-            'track_limits_violations': len(self.analyze_track_limits_violations()),
-            'yellow_flag_periods': len(self.analyze_yellow_flags()),
-            'total_pit_stops': len([pit for strategy in self.analyze_pit_stop_strategies().values() for pit in strategy])
+            'total_position_changes': total,
+            'significant_changes_3plus': significant,
+            'major_changes_5plus': major,
+            'total_incidents': len(incidents),
+            'track_limits_violations': len(track_limits),
+            'yellow_flag_periods': len(yellow_flags),
+            'total_pit_stops': sum(len(strategy) for strategy in pit_stops.values())
         }
     
     def save_analysis(self, output_dir: str = "./analysis_results", format: str = "all") -> None:
@@ -815,81 +1160,86 @@ class F1RaceAnalyzer:
             print("No analysis results to save. Run generate_comprehensive_analysis() first.")
             return
         
-        output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
+        os.makedirs(output_dir, exist_ok=True)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Both reports share one timestamped prefix, built once as a plain string
+        base = os.path.join(output_dir, f"race_analysis_{datetime.now():%Y%m%d_%H%M%S}")
         
-        if format in ["json", "all"]:
-            json_file = output_path / f"race_analysis_{timestamp}.json"
-            with open(json_file, 'w') as f:
-                json.dump(self.analysis_results, f, indent=2, default=str)
-            print(f"Analysis saved to {json_file}")
+        # The JSON and text reports are independent, so encode and write them concurrently
+        writes = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if format in ["json", "all"]:
+                json_file = base + ".json"
+                writes.append((json_file, executor.submit(write_json, json_file, self.analysis_results)))
+            
+            if format in ["txt", "all"]:
+                txt_file = base + ".txt"
+                writes.append((txt_file, executor.submit(self._write_analysis_text, txt_file)))
         
-        if format in ["txt", "all"]:
-            txt_file = output_path / f"race_analysis_{timestamp}.txt"
-            with open(txt_file, 'w') as f:
-                f.write(self._format_analysis_text())
-            print(f"Analysis saved to {txt_file}")
+        for path, write in writes:
+            write.result()
+            print(f"Analysis saved to {path}")
+    
+    def _write_analysis_text(self, path: str) -> None:
+        """Write the readable text report to path."""
+        with open(path, 'w') as f:
+            f.write(self._format_analysis_text())
     
     def _format_analysis_text(self) -> str:
         """Format analysis results as readable text."""
         if not self.analysis_results:
             return "No analysis results available."
         
-        text = []
-        text.append("# F1 Race Analysis Report")
-        text.append("=" * 50)
+        # Every line after the header is written with a leading line break
+        buf = io.StringIO()
+        w = buf.write
+        results = self.analysis_results
+        w("# F1 Race Analysis Report")
+        w("\n" + "=" * 50)
         
         # Race overview
-        overview = self.analysis_results.get('race_overview', {})
-        text.append(f"\n## Race Overview")
-        text.append(f"Total Laps: {overview.get('total_laps', 'Unknown')}")
-        text.append(f"Total Drivers: {overview.get('total_drivers', 'Unknown')}")
+        overview = results.get('race_overview', {})
+        w("\n\n## Race Overview")
+        w(f"\nTotal Laps: {overview.get('total_laps', 'Unknown')}")
+        w(f"\nTotal Drivers: {overview.get('total_drivers', 'Unknown')}")
         
         winner = overview.get('winner')
         if winner:
-            text.append(f"Winner: {winner['name']} ({winner['driver']}) - {winner['team']}")
+            w(f"\nWinner: {winner['name']} ({winner['driver']}) - {winner['team']}")
         
         # Key incidents
-        incidents = self.analysis_results.get('incidents', [])
-        text.append(f"\n## Key Incidents ({len(incidents)})")
+        incidents = results.get('incidents', [])
+        w(f"\n\n## Key Incidents ({len(incidents)})")
         for incident in incidents:
-            text.append(f"Lap {incident['lap']}: {incident['message']}")
-            if 'telemetry_analysis' in incident and incident['telemetry_analysis']:
-                for driver, data in incident['telemetry_analysis'].items():
-                    if 'analysis' in data and 'anomalies' in data['analysis']:
-                        for anomaly in data['analysis']['anomalies']:
-                            text.append(f"  {driver}: {anomaly}")
+            w(f"\nLap {incident['lap']}: {incident['message']}")
+            for driver, data in (incident.get('telemetry_analysis') or {}).items():
+                if 'analysis' in data:
+                    for anomaly in data['analysis'].get('anomalies', ()):
+                        w(f"\n  {driver}: {anomaly}")
         
         # Major position changes
-        changes = self.analysis_results.get('major_position_changes', [])
-        text.append(f"\n## Major Position Changes ({len(changes)})")
+        changes = results.get('major_position_changes', [])
+        w(f"\n\n## Major Position Changes ({len(changes)})")
         for change in changes[:10]:  # Top 10
-            text.append(f"{change['driver']} Lap {change['lap']}: {change['from_position']} → {change['to_position']} ({change['change']:+d})")
-            if 'telemetry_comparison' in change and 'anomalies' in change['telemetry_comparison']:
-                for anomaly in change['telemetry_comparison']['anomalies']:
-                    text.append(f"  {anomaly}")
+            w(f"\n{change['driver']} Lap {change['lap']}: {change['from_position']} → {change['to_position']} ({change['change']:+d})")
+            for anomaly in change.get('telemetry_comparison', {}).get('anomalies', ()):
+                w(f"\n  {anomaly}")
         
         # Track limits violations
-        violations = self.analysis_results.get('track_limits_violations', [])
-        text.append(f"\n## Track Limits Violations ({len(violations)})")
+        violations = results.get('track_limits_violations', [])
+        w(f"\n\n## Track Limits Violations ({len(violations)})")
         for violation in violations:
-            text.append(f"Lap {violation['lap']}: {violation['driver_abbreviation']} - {violation['message']}")
-            if 'telemetry_analysis' in violation and 'analysis' in violation['telemetry_analysis']:
-                analysis = violation['telemetry_analysis']['analysis']
-                if 'anomalies' in analysis:
-                    for anomaly in analysis['anomalies']:
-                        text.append(f"  {anomaly}")
+            w(f"\nLap {violation['lap']}: {violation['driver_abbreviation']} - {violation['message']}")
+            for anomaly in violation.get('telemetry_analysis', {}).get('analysis', {}).get('anomalies', ()):
+                w(f"\n  {anomaly}")
         
         # Commentary segments
-        segments = self.analysis_results.get('commentary_segments', [])
-        text.append(f"\n## Recommended Commentary Segments ({len(segments)})")
+        segments = results.get('commentary_segments', [])
+        w(f"\n\n## Recommended Commentary Segments ({len(segments)})")
         for segment in segments:
-            text.append(f"Priority {segment['priority']}: {segment['title']}")
-            text.append(f"  {segment['description']}")
+            w(f"\nPriority {segment['priority']}: {segment['title']}\n  {segment['description']}")
         
-        return "\n".join(text)
+        return buf.getvalue()
     
     def print_summary(self) -> None:
         """Print analysis summary."""
@@ -3,20 +3,22 @@ Command-line interface for F1 Commentary package.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set
 
-from .config import get_settings, APIKeyManager
+from .config import get_settings, get_key_manager
 from .utils.logging import setup_logging
-from .data import F1DataCollector
-from .analysis import F1RaceAnalyzer
-from .commentary import F1CommentaryGenerator
-from .visualization import F1IncidentVisualizer
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser."""
+def create_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """
+    Create the main argument parser.
+    
+    When argv names a subcommand, only that subcommand's parser is built;
+    otherwise (no argv, help, or an unknown command) all of them are.
+    """
     parser = argparse.ArgumentParser(
         description="F1 Commentary - Comprehensive F1 race analysis and commentary generation",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -47,35 +49,69 @@ Examples:
     # Subcommands
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Collect command
-    collect_parser = subparsers.add_parser('collect', help='Collect F1 race data')
+    command = _sniff_subcommand(argv) if argv is not None else None
+    for name, (help_text, build) in SUBCOMMANDS.items():
+        if command is None or name == command:
+            build(subparsers.add_parser(name, help=help_text))
+    
+    return parser
+
+
+# Global options that take a value, skipped when looking for the subcommand
+_GLOBAL_OPTIONS_WITH_VALUE = ('--log-file', '--config')
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in argv, or None if there is no known one."""
+    args = iter(argv)
+    for arg in args:
+        if arg in _GLOBAL_OPTIONS_WITH_VALUE:
+            next(args, None)
+        elif not arg.startswith('-'):
+            return arg if arg in SUBCOMMANDS else None
+    return None
+
+
+def _build_collect(collect_parser: argparse.ArgumentParser) -> None:
+    """Add the collect command's arguments."""
     collect_parser.add_argument('--year', type=int, required=True, help='Race year')
     collect_parser.add_argument('--race', help='Race number (1-24) or event name')
     collect_parser.add_argument('--event', help='Event name (alternative to --race)')
     collect_parser.add_argument('--session', default='R', help='Session type (FP1, FP2, FP3, Q, R, S)')
     collect_parser.add_argument('--output', help='Output directory')
-    collect_parser.add_argument('--format', default='all', choices=['json', 'csv', 'excel', 'all'], help='Output format')
+    collect_parser.add_argument('--format', default='all', choices=['json', 'csv', 'parquet', 'excel', 'all'], help='Output format')
     collect_parser.add_argument('--cache', help='Cache directory')
+    collect_parser.add_argument('--prefetch-schedule', action='store_true',
+                                help='Fetch the season schedule in the background while the session loads')
     collect_parser.add_argument('--driver', help='Specific driver for telemetry')
+    collect_parser.add_argument('--sections', help='Comma-separated data sections to collect (default: all)')
+    collect_parser.add_argument('--no-telemetry', action='store_true', help='Skip car telemetry collection')
+    collect_parser.add_argument('--pretty', action='store_true', help='Indent JSON output')
+    collect_parser.add_argument('--downcast', action='store_true',
+                                help='Store numbers as float32/int32 (smaller files, about 7 significant digits)')
     collect_parser.add_argument('--summary', action='store_true', help='Print data summary')
-    
-    # Analyze command
-    analyze_parser = subparsers.add_parser('analyze', help='Analyze F1 race data')
+
+
+def _build_analyze(analyze_parser: argparse.ArgumentParser) -> None:
+    """Add the analyze command's arguments."""
     analyze_parser.add_argument('--data-dir', required=True, help='Directory containing race data')
     analyze_parser.add_argument('--race', required=True, help='Name of the race to analyze')
+    analyze_parser.add_argument('--year', type=int, default=2024, help='Race year (for car telemetry)')
     analyze_parser.add_argument('--output', help='Output directory for results')
     analyze_parser.add_argument('--format', default='all', choices=['json', 'txt', 'all'], help='Output format')
     analyze_parser.add_argument('--summary', action='store_true', help='Print analysis summary')
-    
-    # Comment command
-    comment_parser = subparsers.add_parser('comment', help='Generate F1 commentary')
+
+
+def _build_comment(comment_parser: argparse.ArgumentParser) -> None:
+    """Add the comment command's arguments."""
     comment_parser.add_argument('--data-file', required=True, help='JSON file containing race analysis data')
     comment_parser.add_argument('--output', default='commentary_output.json', help='Output file for generated commentary')
     comment_parser.add_argument('--api-key', help='Groq API key')
     comment_parser.add_argument('--model', default='llama-3.1-8b-instant', help='Groq model to use')
-    
-    # Visualize command
-    visualize_parser = subparsers.add_parser('visualize', help='Create incident visualizations')
+
+
+def _build_visualize(visualize_parser: argparse.ArgumentParser) -> None:
+    """Add the visualize command's arguments."""
     visualize_parser.add_argument('--year', type=int, required=True, help='Year of the race')
     visualize_parser.add_argument('--race', required=True, help='Name of the Grand Prix')
     visualize_parser.add_argument('--driver1', required=True, help='First driver code')
@@ -87,9 +123,10 @@ Examples:
     visualize_parser.add_argument('--follow-window', type=float, default=200.0, help='Follow window size')
     visualize_parser.add_argument('--gif-seconds', type=float, help='Target GIF duration')
     visualize_parser.add_argument('--road', action='store_true', help='Add realistic track surface')
-    
-    # Pipeline command
-    pipeline_parser = subparsers.add_parser('pipeline', help='Run full analysis pipeline')
+
+
+def _build_pipeline(pipeline_parser: argparse.ArgumentParser) -> None:
+    """Add the pipeline command's arguments."""
     pipeline_parser.add_argument('--year', type=int, required=True, help='Race year')
     pipeline_parser.add_argument('--race', help='Race number or event name')
     pipeline_parser.add_argument('--event', help='Event name (alternative to --race)')
@@ -99,16 +136,29 @@ Examples:
     pipeline_parser.add_argument('--skip-analyze', action='store_true', help='Skip analysis')
     pipeline_parser.add_argument('--skip-comment', action='store_true', help='Skip commentary generation')
     pipeline_parser.add_argument('--skip-visualize', action='store_true', help='Skip visualization')
-    
-    # Status command
-    status_parser = subparsers.add_parser('status', help='Check system status')
-    
-    return parser
+
+
+def _build_status(status_parser: argparse.ArgumentParser) -> None:
+    """The status command takes no arguments."""
+
+
+# Subcommand name -> (help text, function adding its arguments)
+SUBCOMMANDS = {
+    'collect': ('Collect F1 race data', _build_collect),
+    'analyze': ('Analyze F1 race data', _build_analyze),
+    'comment': ('Generate F1 commentary', _build_comment),
+    'visualize': ('Create incident visualizations', _build_visualize),
+    'pipeline': ('Run full analysis pipeline', _build_pipeline),
+    'status': ('Check system status', _build_status),
+}
 
 
 def handle_collect(args) -> int:
     """Handle the collect command."""
     try:
+        # Imported here so other commands don't load its dependencies
+        from .data import F1DataCollector
+        
         # Determine race identifier
         race_identifier = args.race or args.event
         if not race_identifier:
@@ -116,24 +166,39 @@ def handle_collect(args) -> int:
             return 1
         
         # Initialize collector
-        collector = F1DataCollector(cache_dir=args.cache)
+        collector = F1DataCollector(
+            cache_dir=args.cache,
+            prefetch_year=args.year if args.prefetch_schedule else None
+        )
         
         # Load session
         if not collector.load_session(args.year, race_identifier, args.session):
             print("Failed to load session. Exiting.")
             return 1
         
-        # Collect data
-        data = collector.get_comprehensive_data()
+        # Collect only the requested sections
+        sections = None
+        if args.sections:
+            sections = [name.strip() for name in args.sections.split(',') if name.strip()]
+        if args.no_telemetry:
+            sections = [name for name in (sections or F1DataCollector.SECTIONS) if name != 'telemetry']
+        
+        # Parquet-only output can stream telemetry to disk one driver at a time
+        data = collector.get_comprehensive_data(
+            sections=sections, driver=args.driver,
+            stream_telemetry=args.format == 'parquet'
+        )
         
         # Print summary if requested
         if args.summary:
             collector.print_summary()
         
         # Save data
-        collector.save_data(output_dir=args.output, format=args.format)
+        output_dir = args.output or get_settings().ensure_output_dir()
+        collector.save_data(output_dir=output_dir, format=args.format,
+                            pretty=args.pretty, downcast=args.downcast)
         
-        print(f"Data collection complete! Check {args.output or './f1_data_output'} for output files.")
+        print(f"Data collection complete! Check {output_dir} for output files.")
         return 0
         
     except Exception as e:
@@ -144,8 +209,11 @@ def handle_collect(args) -> int:
 def handle_analyze(args) -> int:
     """Handle the analyze command."""
     try:
+        # Imported here so other commands don't load its dependencies
+        from .analysis import F1RaceAnalyzer
+        
         # Initialize analyzer
-        analyzer = F1RaceAnalyzer(args.data_dir)
+        analyzer = F1RaceAnalyzer(args.data_dir, year=args.year)
         
         # Load race data
         if not analyzer.load_race_data(args.race):
@@ -160,9 +228,10 @@ def handle_analyze(args) -> int:
             analyzer.print_summary()
         
         # Save results
-        analyzer.save_analysis(output_dir=args.output, format=args.format)
+        output_dir = args.output or get_settings().ensure_analysis_dir()
+        analyzer.save_analysis(output_dir=output_dir, format=args.format)
         
-        print(f"Analysis complete! Check {args.output or './analysis_results'} for results.")
+        print(f"Analysis complete! Check {output_dir} for results.")
         return 0
         
     except Exception as e:
@@ -173,10 +242,14 @@ def handle_analyze(args) -> int:
 def handle_comment(args) -> int:
     """Handle the comment command."""
     try:
+        # Imported here so other commands don't load its dependencies
+        from .commentary import F1CommentaryGenerator
+        from .utils.file_utils import read_json, write_json
+        
         # Check API key
         api_key = args.api_key
         if not api_key:
-            key_manager = APIKeyManager()
+            key_manager = get_key_manager()
             api_key = key_manager.get_groq_key()
         
         if not api_key:
@@ -187,9 +260,7 @@ def handle_comment(args) -> int:
         generator = F1CommentaryGenerator(api_key, args.model)
         
         # Load race data
-        import json
-        with open(args.data_file, 'r') as f:
-            race_data = json.load(f)
+        race_data = read_json(args.data_file)
         
         # Generate commentary
         commentaries = generator.process_race_data(race_data)
@@ -204,8 +275,7 @@ def handle_comment(args) -> int:
             'commentaries': commentaries
         }
         
-        with open(args.output, 'w') as f:
-            json.dump(output_data, f, indent=2, default=str)
+        write_json(args.output, output_data)
         
         print(f"Commentary generation complete! Generated {len(commentaries)} commentary pieces.")
         print(f"Results saved to {args.output}")
@@ -250,6 +320,21 @@ def handle_visualize(args) -> int:
         return 1
 
 
+def _latest_analysis_file(analysis_dir: Path) -> Optional[Path]:
+    """Return the most recently modified race_analysis_*.json in a directory."""
+    latest, latest_mtime = None, None
+    try:
+        with os.scandir(analysis_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('race_analysis_') and entry.name.endswith('.json'):
+                    mtime = entry.stat().st_mtime
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest, latest_mtime = Path(entry.path), mtime
+    except FileNotFoundError:
+        return None
+    return latest
+
+
 def handle_pipeline(args) -> int:
     """Handle the pipeline command."""
     try:
@@ -276,7 +361,12 @@ def handle_pipeline(args) -> int:
                 output=f"{output_dir}/data",
                 format='all',
                 cache=None,
+                prefetch_schedule=True,
                 driver=None,
+                sections=None,
+                no_telemetry=False,
+                pretty=False,
+                downcast=False,
                 summary=True
             )
             if handle_collect(collect_args) != 0:
@@ -288,6 +378,7 @@ def handle_pipeline(args) -> int:
             analyze_args = argparse.Namespace(
                 data_dir=f"{output_dir}/data",
                 race=race_identifier,
+                year=args.year,
                 output=f"{output_dir}/analysis",
                 format='all',
                 summary=True
@@ -299,10 +390,8 @@ def handle_pipeline(args) -> int:
         if not args.skip_comment:
             print("\n=== Step 3: Generating Commentary ===")
             # Find the most recent analysis file
-            analysis_dir = Path(f"{output_dir}/analysis")
-            analysis_files = list(analysis_dir.glob("race_analysis_*.json"))
-            if analysis_files:
-                latest_analysis = max(analysis_files, key=lambda p: p.stat().st_mtime)
+            latest_analysis = _latest_analysis_file(Path(f"{output_dir}/analysis"))
+            if latest_analysis is not None:
                 comment_args = argparse.Namespace(
                     data_file=str(latest_analysis),
                     output=f"{output_dir}/commentary.json",
@@ -328,35 +417,62 @@ def handle_pipeline(args) -> int:
         return 1
 
 
+def _existing_paths(paths: List[Path]) -> Set[Path]:
+    """Return the paths that exist, listing each parent directory only once."""
+    existing = set()
+    by_parent: Dict[Path, List[Path]] = {}
+    for path in paths:
+        if path.name in ('', '.', '..'):
+            # Never listed by scandir (e.g. "/" or "..")
+            if path.exists():
+                existing.add(path)
+        else:
+            by_parent.setdefault(path.parent, []).append(path)
+    
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            continue
+        existing.update(path for path in children if path.name in names)
+    return existing
+
+
 def handle_status(args) -> int:
     """Handle the status command."""
     try:
-        print("F1 Commentary System Status")
-        print("=" * 40)
-        
-        # Check API keys
-        key_manager = APIKeyManager()
-        key_manager.print_status()
-        
-        # Check settings
+        # Build the whole report and write it once
+        key_manager = get_key_manager()
         settings = get_settings()
-        print(f"\nConfiguration:")
-        print(f"  Cache directory: {settings.cache_dir}")
-        print(f"  Output directory: {settings.output_dir}")
-        print(f"  Analysis directory: {settings.analysis_dir}")
-        print(f"  Visualization directory: {settings.visualization_dir}")
+        lines = [
+            "F1 Commentary System Status",
+            "=" * 40,
+            key_manager.format_status(),
+            "",
+            "Configuration:",
+            f"  Cache directory: {settings.cache_dir}",
+            f"  Output directory: {settings.output_dir}",
+            f"  Analysis directory: {settings.analysis_dir}",
+            f"  Visualization directory: {settings.visualization_dir}",
+            "",
+            "Directories:",
+        ]
         
         # Check directories
-        print(f"\nDirectories:")
-        for name, path in [
+        directories = [
             ("Cache", settings.cache_dir),
             ("Output", settings.output_dir),
             ("Analysis", settings.analysis_dir),
             ("Visualization", settings.visualization_dir)
-        ]:
-            exists = path.exists()
+        ]
+        existing = _existing_paths([path for _, path in directories])
+        for name, path in directories:
+            exists = path in existing
             status = "✓" if exists else "✗"
-            print(f"  {status} {name}: {path}")
+            lines.append(f"  {status} {name}: {path}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return 0
         
@@ -365,33 +481,35 @@ def handle_status(args) -> int:
         return 1
 
 
+# Subcommand name -> handler, in the same order as SUBCOMMANDS
+HANDLERS = {
+    'collect': handle_collect,
+    'analyze': handle_analyze,
+    'comment': handle_comment,
+    'visualize': handle_visualize,
+    'pipeline': handle_pipeline,
+    'status': handle_status,
+}
+
+
 def main() -> int:
     """Main entry point."""
-    parser = create_parser()
+    parser = create_parser(sys.argv[1:])
     args = parser.parse_args()
     
-    # Set up logging
-    setup_logging(
-        level='DEBUG' if args.verbose else 'INFO',
-        log_file=Path(args.log_file) if args.log_file else None
-    )
+    # Set up logging (not needed when there is no command to run)
+    if args.command is not None:
+        setup_logging(
+            level='DEBUG' if args.verbose else 'INFO',
+            log_file=Path(args.log_file) if args.log_file else None
+        )
     
     # Handle commands
-    if args.command == 'collect':
-        return handle_collect(args)
-    elif args.command == 'analyze':
-        return handle_analyze(args)
-    elif args.command == 'comment':
-        return handle_comment(args)
-    elif args.command == 'visualize':
-        return handle_visualize(args)
-    elif args.command == 'pipeline':
-        return handle_pipeline(args)
-    elif args.command == 'status':
-        return handle_status(args)
-    else:
+    handler = HANDLERS.get(args.command)
+    if handler is None:
         parser.print_help()
         return 1
+    return handler(args)
 
 
 if __name__ == '__main__':
@@ -2,7 +2,15 @@
 F1 commentary generation module.
 """
 
-from .generator import F1CommentaryGenerator
-from .models import CommentaryType, CommentaryResult
+from .._lazy import lazy_getattr
+
+# Public name -> submodule defining it, imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "F1CommentaryGenerator": ".generator",
+    "CommentaryType": ".models",
+    "CommentaryResult": ".models",
+}
 
 __all__ = ["F1CommentaryGenerator", "CommentaryType", "CommentaryResult"]
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
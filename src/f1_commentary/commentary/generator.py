@@ -20,10 +20,22 @@ import requests
 import time
 from dotenv import load_dotenv
 
+from ..utils.file_utils import write_json
+
 
 class F1CommentaryGenerator:
     """Generate F1 commentary from race data using Groq API."""
     
+    # Top-level analysis keys read by process_race_data
+    RACE_DATA_KEYS = (
+        'race_overview',
+        'statistics',
+        'incidents',
+        'major_position_changes',
+        'track_limits_violations',
+        'commentary_segments',
+    )
+    
     def __init__(self, api_key: str, model: str = "llama-3.1-8b-instant"):
         """Initialize the commentary generator."""
         self.api_key = api_key
@@ -361,8 +373,7 @@ def main():
         'commentaries': commentaries
     }
     
-    with open(args.output, 'w') as f:
-        json.dump(output_data, f, indent=2, default=str)
+    write_json(args.output, output_data)
     
     print(f"\nCommentary generation complete!")
     print(f"Generated {len(commentaries)} commentary pieces")
@@ -2,6 +2,7 @@
 Data models for commentary generation.
 """
 
+import sys
 from enum import Enum
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
@@ -16,7 +17,14 @@ class CommentaryType(Enum):
     RACE_SUMMARY = "race_summary"
 
 
-@dataclass
+# Serialized value of each commentary type, looked up by to_dict()
+_TYPE_VALUES = {commentary_type: commentary_type.value for commentary_type in CommentaryType}
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class CommentaryResult:
     """Result of commentary generation."""
     commentary_type: CommentaryType
@@ -27,7 +35,7 @@ class CommentaryResult:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "type": self.commentary_type.value,
+            "type": _TYPE_VALUES[self.commentary_type],
             "commentary": self.commentary_text,
             "source_data": self.source_data,
             "metadata": self.metadata or {}
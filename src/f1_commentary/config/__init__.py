@@ -3,6 +3,6 @@ Configuration management for F1 Commentary package.
 """
 
 from .settings import Settings, get_settings
-from .api_keys import APIKeyManager
+from .api_keys import APIKeyManager, get_key_manager
 
-__all__ = ["Settings", "get_settings", "APIKeyManager"]
+__all__ = ["Settings", "get_settings", "APIKeyManager", "get_key_manager"]
@@ -3,10 +3,27 @@ API key management for external services.
 """
 
 import os
-from typing import Optional, Dict
+import re
+import sys
+from typing import Optional, Dict, TextIO, Tuple
 from pathlib import Path
 
 
+# Environment variables holding API keys -> internal key names
+ENV_KEY_MAPPINGS = {
+    'GROQ_API_KEY': 'groq_api_key',
+    'OPENAI_API_KEY': 'openai_api_key',
+    'ELEVENLABS_API_KEY': 'elevenlabs_api_key',
+}
+_ENV_KEY_NAMES = frozenset(ENV_KEY_MAPPINGS)
+
+# One `API_KEY_*=value` or `*_API_KEY=value` assignment per line in a .env file
+_ENV_KEY_LINE = re.compile(
+    r'^[ \t]*(API_KEY_[^=\n]*?|(?![\s#])[^=\n]*?_API_KEY)[ \t]*=[ \t]*(.*?)[ \t\r]*$',
+    re.MULTILINE
+)
+
+
 class APIKeyManager:
     """Manages API keys for external services."""
     
@@ -14,6 +31,7 @@ class APIKeyManager:
         """Initialize API key manager."""
         self.env_file = env_file or Path(".env")
         self._keys: Dict[str, Optional[str]] = {}
+        self._validation: Optional[Dict[str, bool]] = None
         self._load_keys()
     
     def _load_keys(self) -> None:
@@ -28,31 +46,19 @@ class APIKeyManager:
     def _load_from_env_file(self) -> None:
         """Load API keys from .env file."""
         try:
-            with open(self.env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        if key.startswith('API_KEY_') or key.endswith('_API_KEY'):
-                            self._keys[key] = value
+            content = self.env_file.read_text()
+            for match in _ENV_KEY_LINE.finditer(content):
+                self._keys[match.group(1)] = match.group(2).strip('"').strip("'")
         except Exception as e:
             print(f"Warning: Could not load .env file: {e}")
     
     def _load_from_environment(self) -> None:
         """Load API keys from environment variables."""
-        # Common API key environment variable names
-        key_mappings = {
-            'GROQ_API_KEY': 'groq_api_key',
-            'OPENAI_API_KEY': 'openai_api_key',
-            'ELEVENLABS_API_KEY': 'elevenlabs_api_key',
-        }
-        
-        for env_var, internal_key in key_mappings.items():
-            value = os.getenv(env_var)
+        # Only look at the key variables that are actually set
+        for env_var in _ENV_KEY_NAMES & os.environ.keys():
+            value = os.environ[env_var]
             if value:
-                self._keys[internal_key] = value
+                self._keys[ENV_KEY_MAPPINGS[env_var]] = value
     
     def get_key(self, service: str) -> Optional[str]:
         """Get API key for a service."""
@@ -61,6 +67,7 @@ class APIKeyManager:
     def set_key(self, service: str, key: str) -> None:
         """Set API key for a service."""
         self._keys[service] = key
+        self._validation = None
     
     def has_key(self, service: str) -> bool:
         """Check if API key exists for a service."""
@@ -80,28 +87,51 @@ class APIKeyManager:
     
     def validate_keys(self) -> Dict[str, bool]:
         """Validate that required API keys are present."""
-        validation = {}
+        if self._validation is None:
+            # Check for required keys
+            required_keys = ['groq_api_key']
+            self._validation = {key: self.has_key(key) for key in required_keys}
         
-        # Check for required keys
-        required_keys = ['groq_api_key']
-        for key in required_keys:
-            validation[key] = self.has_key(key)
-        
-        return validation
+        return dict(self._validation)
     
-    def print_status(self) -> None:
-        """Print API key status."""
-        print("API Key Status:")
-        print("=" * 40)
+    def format_status(self) -> str:
+        """Format the API key status report."""
+        lines = ["API Key Status:", "=" * 40]
         
         validation = self.validate_keys()
         for key, is_valid in validation.items():
             status = "✓" if is_valid else "✗"
-            print(f"{status} {key}: {'Available' if is_valid else 'Missing'}")
+            lines.append(f"{status} {key}: {'Available' if is_valid else 'Missing'}")
         
         # Show optional keys
         optional_keys = ['openai_api_key', 'elevenlabs_api_key']
         for key in optional_keys:
             is_available = self.has_key(key)
             status = "✓" if is_available else "○"
-            print(f"{status} {key}: {'Available' if is_available else 'Not set'}")
+            lines.append(f"{status} {key}: {'Available' if is_available else 'Not set'}")
+        
+        return "\n".join(lines)
+    
+    def print_status(self, out: Optional[TextIO] = None) -> None:
+        """Print API key status."""
+        (out or sys.stdout).write(self.format_status() + "\n")
+
+# Cached managers by .env path, with the file's mtime when they were loaded
+_KEY_MANAGER_CACHE: Dict[Path, Tuple[Optional[float], APIKeyManager]] = {}
+
+
+def get_key_manager(env_file: Optional[Path] = None) -> APIKeyManager:
+    """Get a shared API key manager, reloaded when the .env file changes."""
+    env_file = env_file or Path(".env")
+    try:
+        mtime = env_file.stat().st_mtime
+    except OSError:
+        mtime = None
+    
+    cached = _KEY_MANAGER_CACHE.get(env_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    manager = APIKeyManager(env_file)
+    _KEY_MANAGER_CACHE[env_file] = (mtime, manager)
+    return manager
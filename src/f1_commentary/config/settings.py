@@ -38,17 +38,56 @@ class Settings:
     log_level: str = "INFO"
     log_file: Optional[Path] = None
     
+    # Directories already created by ensure_*_dir()
+    _ensured: set = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    # to_dict() result, cleared whenever a setting changes
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping the cached to_dict() result."""
+        object.__setattr__(self, name, value)
+        if not name.startswith('_'):
+            object.__setattr__(self, '_dict_cache', None)
+    
     def __post_init__(self):
         """Initialize settings after creation."""
-        # Create directories if they don't exist
-        for directory in [self.cache_dir, self.output_dir, self.analysis_dir, self.visualization_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
+        # Directories are created on demand by the ensure_*_dir() methods
         
         # Load API keys from environment
         self.groq_api_key = self.groq_api_key or os.getenv("GROQ_API_KEY")
     
+    def _ensure_dir(self, directory: Path) -> Path:
+        """Create a directory the first time it is needed."""
+        if directory not in self._ensured:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured.add(directory)
+        return directory
+    
+    def ensure_cache_dir(self) -> Path:
+        """Return the cache directory, creating it if needed."""
+        return self._ensure_dir(self.cache_dir)
+    
+    def ensure_output_dir(self) -> Path:
+        """Return the data output directory, creating it if needed."""
+        return self._ensure_dir(self.output_dir)
+    
+    def ensure_analysis_dir(self) -> Path:
+        """Return the analysis directory, creating it if needed."""
+        return self._ensure_dir(self.analysis_dir)
+    
+    def ensure_visualization_dir(self) -> Path:
+        """Return the visualization directory, creating it if needed."""
+        return self._ensure_dir(self.visualization_dir)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary."""
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return dict(self._dict_cache)
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the dictionary returned by to_dict()."""
         return {
             "groq_api_key": self.groq_api_key,
             "cache_dir": str(self.cache_dir),
@@ -81,12 +120,10 @@ def get_settings() -> Settings:
 
 def update_settings(**kwargs) -> None:
     """Update global settings with new values."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
+    settings = get_settings()
     
     for key, value in kwargs.items():
-        if hasattr(_settings, key):
-            setattr(_settings, key, value)
+        if hasattr(settings, key):
+            setattr(settings, key, value)
         else:
             raise ValueError(f"Unknown setting: {key}")
@@ -2,7 +2,14 @@
 F1 data collection and processing module.
 """
 
-from .collector import F1DataCollector
-from .processor import DataProcessor
+from .._lazy import lazy_getattr
+
+# Public name -> submodule defining it, imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "F1DataCollector": ".collector",
+    "DataProcessor": ".processor",
+}
 
 __all__ = ["F1DataCollector", "DataProcessor"]
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
@@ -5,33 +5,215 @@ This module provides comprehensive F1 race data collection using the FastF1 API.
 It collects race results, lap times, telemetry, weather data, and more.
 """
 
-import json
 import logging
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import fastf1
+import numpy as np
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import get_settings
+from ..utils.file_utils import write_json
 
 logger = logging.getLogger(__name__)
 
+# FastF1 HTTP sessions that already have the pooled adapter mounted
+_pooled_sessions = weakref.WeakSet()
+
+# Frames longer than this are re-laid out row-major before row-wise export
+ROW_MAJOR_MIN_ROWS = 10_000
+
+# File buffer for CSV/JSON Lines output, and rows pandas formats per CSV chunk
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+CSV_CHUNK_ROWS = 100_000
+
+# Tables whose numbers are written at full precision even when downcasting
+DOWNCAST_EXCLUDE = frozenset({"session_results"})
+
+
+def _enable_connection_pooling() -> None:
+    """
+    Mount a larger keep-alive connection pool on FastF1's HTTP sessions.
+    
+    FastF1 keeps its (rate limited, cached) requests sessions on its Cache
+    class, so they are shared process-wide and only need mounting once.
+    """
+    cache = getattr(getattr(fastf1, 'req', None), 'Cache', None)
+    for attr in ('_requests_session', '_requests_session_cached'):
+        session = getattr(cache, attr, None)
+        if session is None or session in _pooled_sessions:
+            continue
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _pooled_sessions.add(session)
+
+
+class _SafeNameTable(dict):
+    """str.translate table keeping alphanumerics, spaces, hyphens and underscores."""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in ' -_' else None
+        self[codepoint] = value
+        return value
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+
+@lru_cache(maxsize=16)
+def _load_session_cached(year: int, race: Union[int, str], session_type: str):
+    """Load a FastF1 session, reusing it if it was already loaded in this process."""
+    session = fastf1.get_session(year, race, session_type)
+    session.load()
+    return session
+
+
+def _to_row_major(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rebuild numeric columns as C-contiguous blocks for row-wise writers.
+    
+    FastF1 builds telemetry column by column, so CSV and JSON Lines writers
+    walking it row by row stride across memory. Columns are grouped by dtype
+    so the copy never upcasts (e.g. ints to floats).
+    """
+    columns_by_dtype = {}
+    for column, dtype in df.dtypes.items():
+        columns_by_dtype.setdefault(dtype, []).append(column)
+    
+    parts = []
+    for dtype, columns in columns_by_dtype.items():
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            block = np.ascontiguousarray(df[columns].to_numpy())
+            parts.append(pd.DataFrame(block, columns=columns, index=df.index))
+        else:
+            parts.append(df[columns])
+    
+    return pd.concat(parts, axis=1)[df.columns]
+
+
+def _to_arrow(df: pd.DataFrame, preserve_index: Optional[bool] = None):
+    """Convert a DataFrame to a pyarrow Table, converting columns in parallel."""
+    import pyarrow as pa
+    return pa.Table.from_pandas(df, preserve_index=preserve_index, nthreads=os.cpu_count())
+
+
+def _stream_schema(schema, downcast: bool = False):
+    """
+    Fix the schema of a streamed Parquet file from its first table's schema.
+    
+    Columns that are all missing in the first table (Arrow's null type) are
+    stored as text, so later tables with values can still be cast. Downcasting
+    is decided from the types alone, not per table: float64 columns become
+    float32, while integer columns keep their width since later tables may
+    not fit a narrower one.
+    """
+    import pyarrow as pa
+    fields = []
+    for field in schema:
+        if pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        elif downcast and pa.types.is_float64(field.type):
+            field = field.with_type(pa.float32())
+        fields.append(field)
+    # The pandas metadata describes the first frame's dtypes, which may no longer match
+    return pa.schema(fields)
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Narrow float64 columns to float32 and int64 columns to int32 where the
+    values fit, halving their size on disk and in memory.
+    
+    Timedeltas are left alone; the analyzer parses lap times back from text.
+    """
+    floats = df.select_dtypes(include='float64').columns
+    ints = df.select_dtypes(include='int64').columns
+    if floats.empty and ints.empty:
+        return df
+    
+    float32 = np.finfo(np.float32)
+    int32 = np.iinfo(np.int32)
+    df = df.copy(deep=False)
+    for column in floats:
+        values = df[column]
+        if values.abs().max() <= float32.max:
+            df[column] = values.astype(np.float32)
+    for column in ints:
+        values = df[column]
+        if values.empty or (values.min() >= int32.min and values.max() <= int32.max):
+            df[column] = values.astype(np.int32)
+    return df
+
 
 class F1DataCollector:
     """Comprehensive F1 race data collector using FastF1 API."""
     
-    def __init__(self, cache_dir: Optional[str] = None):
-        """Initialize the data collector with caching enabled."""
+    # Section names accepted by get_comprehensive_data -> data keys
+    SECTIONS = {
+        "event": "event_info",
+        "results": "session_results",
+        "laps": "lap_data",
+        "weather": "weather_data",
+        "track_status": "track_status",
+        "session_status": "session_status",
+        "race_control": "race_control_messages",
+        "drivers": "driver_info",
+        "teams": "team_info",
+        "telemetry": "telemetry_data",
+    }
+    
+    def __init__(self, cache_dir: Optional[str] = None, prefetch_year: Optional[int] = None):
+        """
+        Initialize the data collector with caching enabled.
+        
+        Args:
+            cache_dir: FastF1 cache directory (defaults to the configured one)
+            prefetch_year: Fetch this season's event schedule in a background
+                thread so it is already cached when load_session needs it
+        """
         settings = get_settings()
-        self.cache_dir = Path(cache_dir) if cache_dir else settings.cache_dir
-        self.cache_dir.mkdir(exist_ok=True)
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            self.cache_dir = settings.ensure_cache_dir()
         fastf1.Cache.enable_cache(str(self.cache_dir))
+        _enable_connection_pooling()
         self.session = None
         self.data = {}
+        self._event_info: Optional[Dict] = None
+        
+        self._schedule_prefetch = None
+        if prefetch_year is not None:
+            self._schedule_prefetch = threading.Thread(
+                target=self._prefetch_schedule, args=(prefetch_year,), daemon=True
+            )
+            self._schedule_prefetch.start()
         logger.info(f"Initialized F1DataCollector with cache directory: {self.cache_dir}")
         
+    def _prefetch_schedule(self, year: int) -> None:
+        """Warm the FastF1 cache with a season's event schedule."""
+        try:
+            fastf1.get_event_schedule(year)
+        except Exception as e:
+            logger.debug(f"Schedule prefetch for {year} failed: {e}")
+    
     def load_session(self, year: int, race: Union[int, str], session_type: str) -> bool:
         """
         Load a specific F1 session.
@@ -46,32 +228,47 @@ class F1DataCollector:
         """
         try:
             print(f"Loading {year} {race} {session_type} session...")
-            self.session = fastf1.get_session(year, race, session_type)
-            self.session.load()
+            # Let a running schedule prefetch finish rather than fetch it twice
+            if self._schedule_prefetch is not None:
+                self._schedule_prefetch.join()
+                self._schedule_prefetch = None
+            self._event_info = None
+            self.session = _load_session_cached(year, race, session_type)
             print("Session loaded successfully!")
             return True
         except Exception as e:
             print(f"Error loading session: {e}")
             return False
     
+    @classmethod
+    def clear_memory_cache(cls) -> None:
+        """Drop sessions kept in memory by load_session (the disk cache is untouched)."""
+        _load_session_cached.cache_clear()
+    
     def get_event_info(self) -> Dict:
         """Get comprehensive event information."""
         if not self.session:
             return {}
+        
+        if self._event_info is not None:
+            return self._event_info
             
         event = self.session.event
-        return {
+        event_date = getattr(event, 'EventDate', None)
+        session_date = getattr(event, 'SessionDate', None)
+        self._event_info = {
             "event_name": getattr(event, 'EventName', 'Unknown'),
             "location": getattr(event, 'Location', 'Unknown'),
             "country": getattr(event, 'Country', 'Unknown'),
             "circuit_name": getattr(event, 'Location', 'Unknown'),
-            "date": event.EventDate.strftime("%Y-%m-%d") if hasattr(event, 'EventDate') and event.EventDate else None,
+            "date": event_date.strftime("%Y-%m-%d") if event_date else None,
             "session_name": getattr(event, 'SessionName', 'Unknown'),
-            "session_date": event.SessionDate.strftime("%Y-%m-%d %H:%M:%S") if hasattr(event, 'SessionDate') and event.SessionDate else None,
+            "session_date": session_date.strftime("%Y-%m-%d %H:%M:%S") if session_date else None,
             "session_type": getattr(event, 'SessionType', 'Unknown'),
             "event_format": getattr(event, 'EventFormat', 'Unknown'),
             "f1_api_support": getattr(event, 'F1ApiSupport', False)
         }
+        return self._event_info
     
     def get_session_results(self) -> pd.DataFrame:
         """Get session results (final standings)."""
@@ -85,6 +282,18 @@ class F1DataCollector:
             return pd.DataFrame()
         return self.session.laps
     
+    def get_lap_data_arrow(self):
+        """
+        Get lap data as a pyarrow Table.
+        
+        Columnar consumers (Parquet, Arrow IPC) can use this directly instead
+        of going through a pandas frame and converting it on every write.
+        """
+        import pyarrow as pa
+        if not self.session:
+            return pa.table({})
+        return _to_arrow(self.session.laps)
+    
     def get_telemetry_data(self, driver: str = None) -> Dict[str, pd.DataFrame]:
         """
         Get telemetry data for all drivers or a specific driver.
@@ -98,24 +307,69 @@ class F1DataCollector:
         if not self.session:
             return {}
             
-        telemetry_data = {}
         laps = self.session.laps
         
         if driver:
             drivers = [driver]
         else:
-            drivers = self.session.drivers
-            
+            drivers = list(self.session.drivers)
+        
+        if not drivers:
+            return {}
+        
+        laps_by_driver = self._group_laps_by_driver(laps) if len(drivers) > 1 else {}
+        
+        # Per-driver extraction is independent, so run it across a thread pool
+        telemetry_data = {}
+        max_workers = min(len(drivers), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._get_driver_telemetry, laps, drv, laps_by_driver) for drv in drivers]
+            for drv, future in zip(drivers, futures):
+                try:
+                    telemetry = future.result()
+                    if telemetry is not None:
+                        telemetry_data[drv] = telemetry
+                except Exception as e:
+                    print(f"Error getting telemetry for {drv}: {e}")
+                
+        return telemetry_data
+    
+    def _group_laps_by_driver(self, laps: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Split laps by driver number in one pass instead of filtering once per driver."""
+        return {str(number): group for number, group in laps.groupby('DriverNumber', sort=False)}
+    
+    def _get_driver_telemetry(self, laps: pd.DataFrame, driver: str,
+                              laps_by_driver: Optional[Dict[str, pd.DataFrame]] = None) -> Optional[pd.DataFrame]:
+        """Get car telemetry for a single driver, or None if they have no laps."""
+        driver_laps = laps_by_driver.get(str(driver)) if laps_by_driver else None
+        if driver_laps is None:
+            # Abbreviations and single-driver lookups go through FastF1
+            driver_laps = laps.pick_driver(driver)
+        if driver_laps.empty:
+            return None
+        return driver_laps.get_car_data()
+    
+    def iter_telemetry(self, driver: str = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Yield (driver, telemetry) pairs one driver at a time.
+        
+        Unlike get_telemetry_data, only one driver's telemetry needs to be in
+        memory at once, so callers can write each frame out and drop it.
+        """
+        if not self.session:
+            return
+        
+        laps = self.session.laps
+        drivers = [driver] if driver else list(self.session.drivers)
+        laps_by_driver = self._group_laps_by_driver(laps) if len(drivers) > 1 else {}
         for drv in drivers:
             try:
-                driver_laps = laps.pick_driver(drv)
-                if not driver_laps.empty:
-                    telemetry = driver_laps.get_car_data()
-                    telemetry_data[drv] = telemetry
+                telemetry = self._get_driver_telemetry(laps, drv, laps_by_driver)
             except Exception as e:
                 print(f"Error getting telemetry for {drv}: {e}")
-                
-        return telemetry_data
+                continue
+            if telemetry is not None:
+                yield drv, telemetry
     
     def get_weather_data(self) -> pd.DataFrame:
         """Get weather data for the session."""
@@ -145,20 +399,29 @@ class F1DataCollector:
         """Get comprehensive driver information."""
         if not self.session:
             return {}
+        
+        # Read every driver from the results table in one pass rather than
+        # filtering it once per driver with session.get_driver
+        columns = ['FullName', 'FirstName', 'LastName', 'CountryCode', 'TeamName', 'TeamColor', 'DriverNumber']
+        try:
+            results = self.session.results
+            rows = results.set_index(results['DriverNumber'].astype(str))[columns].to_dict(orient='index')
+        except (KeyError, ValueError):
+            rows = {}
             
         driver_info = {}
         for driver in self.session.drivers:
             try:
-                driver_data = self.session.get_driver(driver)
+                driver_data = rows.get(str(driver)) or self.session.get_driver(driver)
                 driver_info[driver] = {
                     "abbreviation": driver,
-                    "full_name": driver_data.FullName,
-                    "first_name": driver_data.FirstName,
-                    "last_name": driver_data.LastName,
-                    "country": driver_data.CountryCode,
-                    "team": driver_data.TeamName,
-                    "team_color": driver_data.TeamColor,
-                    "driver_number": driver_data.DriverNumber
+                    "full_name": driver_data['FullName'],
+                    "first_name": driver_data['FirstName'],
+                    "last_name": driver_data['LastName'],
+                    "country": driver_data['CountryCode'],
+                    "team": driver_data['TeamName'],
+                    "team_color": driver_data['TeamColor'],
+                    "driver_number": driver_data['DriverNumber']
                 }
             except Exception as e:
                 print(f"Error getting driver info for {driver}: {e}")
@@ -175,46 +438,85 @@ class F1DataCollector:
         try:
             results = self.session.results
             if not results.empty:
-                for _, row in results.iterrows():
-                    team_name = row.get('TeamName', 'Unknown')
-                    if team_name not in team_info:
-                        team_info[team_name] = {
-                            "name": team_name,
-                            "full_name": team_name,
-                            "country": "Unknown"
-                        }
+                teams = results.get('TeamName', pd.Series(['Unknown']))
+                team_info = {
+                    team_name: {
+                        "name": team_name,
+                        "full_name": team_name,
+                        "country": "Unknown"
+                    }
+                    for team_name in teams.dropna().drop_duplicates()
+                }
         except Exception as e:
             print(f"Error getting team info: {e}")
                 
         return team_info
     
-    def get_comprehensive_data(self) -> Dict:
-        """Collect all available data for the session."""
+    def get_comprehensive_data(self, sections: Optional[Iterable[str]] = None,
+                               driver: Optional[str] = None,
+                               stream_telemetry: bool = False) -> Dict:
+        """
+        Collect available data for the session.
+        
+        Args:
+            sections: Section names to collect (see SECTIONS), or None for all.
+                Only the requested sections are fetched, so leaving out
+                'telemetry' skips the most expensive step.
+            driver: Limit telemetry to one driver abbreviation
+            stream_telemetry: Leave telemetry_data as a lazy iterator from
+                iter_telemetry. save_data's Parquet writer then streams it
+                to disk one driver at a time instead of holding every
+                driver's telemetry in memory. It can only be saved once.
+            
+        Returns:
+            Dict mapping data keys to the collected data
+        """
         print("Collecting comprehensive race data...")
         
-        data = {
-            "event_info": self.get_event_info(),
-            "session_results": self.get_session_results(),
-            "lap_data": self.get_lap_data(),
-            "weather_data": self.get_weather_data(),
-            "track_status": self.get_track_status(),
-            "session_status": self.get_session_status(),
-            "race_control_messages": self.get_race_control_messages(),
-            "driver_info": self.get_driver_info(),
-            "team_info": self.get_team_info(),
-            "telemetry_data": self.get_telemetry_data()
+        getters = {
+            "event_info": self.get_event_info,
+            "session_results": self.get_session_results,
+            "lap_data": self.get_lap_data,
+            "weather_data": self.get_weather_data,
+            "track_status": self.get_track_status,
+            "session_status": self.get_session_status,
+            "race_control_messages": self.get_race_control_messages,
+            "driver_info": self.get_driver_info,
+            "team_info": self.get_team_info,
+            "telemetry_data": lambda: (self.iter_telemetry(driver) if stream_telemetry
+                                       else self.get_telemetry_data(driver))
         }
         
+        if sections is None:
+            wanted = set(getters)
+        else:
+            unknown = [name for name in sections if name not in self.SECTIONS]
+            if unknown:
+                raise ValueError(f"Unknown data section(s): {', '.join(unknown)}")
+            wanted = {self.SECTIONS[name] for name in sections}
+        
+        data = {key: getter() for key, getter in getters.items() if key in wanted}
+        
         self.data = data
         return data
     
-    def save_data(self, output_dir: str = "./f1_data_output", format: str = "json") -> None:
+    def save_data(self, output_dir: str = "./f1_data_output", format: str = "json",
+                  pretty: bool = False, downcast: bool = False) -> None:
         """
         Save collected data to files.
         
         Args:
             output_dir: Directory to save data files
-            format: Output format ('json', 'csv', 'excel', 'all')
+            format: Output format ('json', 'csv', 'parquet', 'excel', 'all').
+                'all' writes JSON, CSV and Parquet; Excel is only written when
+                requested explicitly. Parquet keeps dtypes such as timedeltas
+                and categoricals that CSV flattens to text.
+            pretty: Indent JSON output. Off by default since indentation
+                roughly triples the file size.
+            downcast: Store float64/int64 columns as float32/int32 in every
+                format. Off by default since float32 keeps only about 7
+                significant digits. Tables in DOWNCAST_EXCLUDE are always
+                kept at full precision.
         """
         if not self.data:
             print("No data to save. Run get_comprehensive_data() first.")
@@ -226,41 +528,193 @@ class F1DataCollector:
         # Create timestamp for unique filenames
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         event_name = self.data.get("event_info", {}).get("event_name", "unknown")
-        safe_event_name = "".join(c for c in event_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        safe_event_name = event_name.translate(_SAFE_NAME_TABLE).rstrip()
         
-        if format in ["json", "all"]:
-            # Save as JSON
-            json_data = {}
+        want_json = format in ["json", "all"]
+        want_csv = format in ["csv", "all"]
+        want_parquet = format in ["parquet", "all"]
+        want_excel = format == "excel"
+        
+        # Lazily collected telemetry can only be streamed by the Parquet writer
+        if format != "parquet":
             for key, value in self.data.items():
-                if isinstance(value, pd.DataFrame):
-                    json_data[key] = value.to_dict('records')
-                else:
-                    json_data[key] = value
+                if isinstance(value, Iterator):
+                    self.data[key] = dict(value)
+        
+        base_name = f"{safe_event_name}_{timestamp}"
+        json_dir = output_path / f"{base_name}_json"
+        csv_dir = output_path / f"{base_name}_csv"
+        parquet_dir = output_path / f"{base_name}_parquet"
+        excel_file = output_path / f"{base_name}.xlsx"
+        
+        for wanted, directory in [(want_json, json_dir), (want_csv, csv_dir), (want_parquet, parquet_dir)]:
+            if wanted:
+                directory.mkdir(exist_ok=True)
+        
+        # Sort the items once; each writer below only visits what it can handle
+        frames, frame_groups, others = [], [], []
+        for key, value in self.data.items():
+            if isinstance(value, pd.DataFrame):
+                frames.append((key, value))
+            elif isinstance(value, Iterator) or (
+                    isinstance(value, dict) and value and all(isinstance(v, pd.DataFrame) for v in value.values())):
+                frame_groups.append((key, value))
+            else:
+                others.append((key, value))
+        non_empty = [(key, value) for key, value in frames if not value.empty]
+        empty = [(key, value) for key, value in frames if value.empty]
+        
+        if empty and (want_csv or want_parquet or want_excel):
+            print(f"Skipping {len(empty)} empty table(s): {', '.join(key for key, _ in empty)}")
+        
+        # JSON writes each DataFrame in pandas' 'split' layout (column names once,
+        # then row arrays) with its C encoder; everything else goes into a small
+        # index file alongside them
+        index = dict(others) if want_json else {}
+        
+        # Visit each item once and hand it to every requested writer. Each file
+        # is independent, so file writes run on a thread pool; the Excel
+        # workbook is a single file and stays on this thread.
+        writes = []
+        with ExitStack() as stack:
+            excel_writer = None
+            if want_excel:
+                excel_writer = stack.enter_context(pd.ExcelWriter(excel_file, **self._excel_writer_options()))
+            executor = stack.enter_context(
+                ThreadPoolExecutor(max_workers=max(1, min(8, len(frames) + len(frame_groups))))
+            )
             
-            json_file = output_path / f"{safe_event_name}_{timestamp}.json"
-            with open(json_file, 'w') as f:
-                json.dump(json_data, f, indent=2, default=str)
-            print(f"Data saved to {json_file}")
-        
-        if format in ["csv", "all"]:
-            # Save DataFrames as CSV
-            csv_dir = output_path / f"{safe_event_name}_{timestamp}_csv"
-            csv_dir.mkdir(exist_ok=True)
+            if want_json:
+                for key, value in empty:
+                    json_file = json_dir / f"{key}.json"
+                    writes.append((None, executor.submit(self._write_json_split, value, json_file, pretty)))
+                    index[key] = json_file.name
             
-            for key, value in self.data.items():
-                if isinstance(value, pd.DataFrame) and not value.empty:
+            for key, value in non_empty:
+                if downcast and key not in DOWNCAST_EXCLUDE:
+                    value = _downcast(value)
+                
+                # CSV and JSON share one row-major copy of large frames
+                row_wise = value
+                if (want_json or want_csv) and len(value) > ROW_MAJOR_MIN_ROWS:
+                    row_wise = _to_row_major(value)
+                
+                if want_json:
+                    json_file = json_dir / f"{key}.json"
+                    writes.append((None, executor.submit(self._write_json_split, row_wise, json_file, pretty)))
+                    index[key] = json_file.name
+                
+                if want_csv:
                     csv_file = csv_dir / f"{key}.csv"
-                    value.to_csv(csv_file, index=False)
-                    print(f"{key} saved to {csv_file}")
-        
-        if format in ["excel", "all"]:
-            # Save as Excel with multiple sheets
-            excel_file = output_path / f"{safe_event_name}_{timestamp}.xlsx"
-            with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-                for key, value in self.data.items():
-                    if isinstance(value, pd.DataFrame) and not value.empty:
-                        value.to_excel(writer, sheet_name=key, index=False)
-                print(f"Data saved to {excel_file}")
+                    writes.append((f"{key} saved to {csv_file}",
+                                   executor.submit(self._write_csv, row_wise, csv_file)))
+                
+                if want_parquet:
+                    parquet_file = parquet_dir / f"{key}.parquet"
+                    writes.append((f"{key} saved to {parquet_file}",
+                                   executor.submit(self._write_parquet, value, parquet_file)))
+                
+                if excel_writer is not None:
+                    value.to_excel(excel_writer, sheet_name=key, index=False)
+            
+            for key, value in frame_groups:
+                # Per-driver frames: one JSON file each, one Parquet file overall
+                if want_json:
+                    index[key] = {}
+                    for name, frame in value.items():
+                        if downcast and key not in DOWNCAST_EXCLUDE:
+                            frame = _downcast(frame)
+                        if len(frame) > ROW_MAJOR_MIN_ROWS:
+                            frame = _to_row_major(frame)
+                        index[key][name] = self._write_json_split(frame, json_dir / f"{key}_{name}.json", pretty)
+                
+                if want_parquet:
+                    parquet_file = parquet_dir / f"{key}.parquet"
+                    frames_to_write = value.items() if isinstance(value, dict) else value
+                    writes.append((f"{key} saved to {parquet_file}",
+                                   executor.submit(self._write_frames_parquet, frames_to_write, parquet_file,
+                                                   downcast and key not in DOWNCAST_EXCLUDE)))
+            
+            for message, future in writes:
+                future.result()
+                if message:
+                    print(message)
+        
+        if want_json:
+            write_json(json_dir / "index.json", index, indent=pretty)
+            print(f"Data saved to {json_dir}")
+        
+        if want_excel:
+            print(f"Data saved to {excel_file}")
+    
+    def _excel_writer_options(self) -> Dict:
+        """
+        Pick the fastest available Excel engine.
+        
+        xlsxwriter's constant_memory mode is not used: pandas writes cells
+        column by column, and constant_memory drops anything written out of
+        row order.
+        """
+        try:
+            import xlsxwriter  # noqa: F401
+        except ImportError:
+            return {'engine': 'openpyxl'}
+        return {
+            'engine': 'xlsxwriter',
+            'engine_kwargs': {'options': {'strings_to_urls': False, 'nan_inf_to_errors': True}}
+        }
+    
+    def _write_csv(self, df: pd.DataFrame, path: Path) -> None:
+        """Write a DataFrame as CSV through a large write buffer."""
+        with open(path, 'w', buffering=WRITE_BUFFER_SIZE, newline='') as f:
+            df.to_csv(f, index=False, chunksize=CSV_CHUNK_ROWS)
+    
+    def _write_parquet(self, df: pd.DataFrame, path: Path) -> None:
+        """Write a DataFrame (or pyarrow Table) as zstd-compressed Parquet."""
+        import pyarrow.parquet as pq
+        table = df if not isinstance(df, pd.DataFrame) else _to_arrow(df)
+        pq.write_table(table, path, compression='zstd', use_dictionary=True)
+    
+    def _write_frames_parquet(self, frames: Iterable[Tuple[str, pd.DataFrame]], path: Path,
+                              downcast: bool = False) -> None:
+        """
+        Stream (driver, frame) pairs into one Parquet file.
+        
+        Each driver becomes its own row group tagged with a Driver column, so
+        only one frame is held in memory at a time. The file schema is fixed
+        from the first frame's dtypes and every frame is cast to it; a frame
+        that cannot be cast removes the partial file rather than leaving it
+        truncated.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        writer = None
+        try:
+            for driver, frame in frames:
+                if frame.empty:
+                    continue
+                table = _to_arrow(frame, preserve_index=False)
+                table = table.append_column('Driver', pa.array([str(driver)] * len(table), pa.string()))
+                if writer is None:
+                    writer = pq.ParquetWriter(path, _stream_schema(table.schema, downcast), compression='zstd')
+                writer.write_table(table.select(writer.schema.names).cast(writer.schema))
+        except BaseException:
+            if writer is not None:
+                writer.close()
+                path.unlink()
+            raise
+        
+        if writer is not None:
+            writer.close()
+    
+    def _write_json_split(self, df: pd.DataFrame, path: Path, pretty: bool = False) -> str:
+        """Write a DataFrame as {"columns": [...], "data": [[...], ...]} and return the file name."""
+        with open(path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+            # pandas keeps 10 significant digits by default; 15 is its maximum
+            df.to_json(f, orient='split', index=False, date_format='iso', double_precision=15,
+                       default_handler=str, indent=2 if pretty else 0)
+        return path.name
     
     def print_summary(self) -> None:
         """Print a summary of the collected data."""
@@ -282,8 +736,9 @@ class F1DataCollector:
         if results is not None and not results.empty:
             print(f"\nResults: {len(results)} drivers")
             print("Top 3:")
-            for i, (_, row) in enumerate(results.head(3).iterrows()):
-                print(f"  {i+1}. {row['Abbreviation']} - {row['FullName']} ({row['TeamName']})")
+            top3 = results.head(3)[['Abbreviation', 'FullName', 'TeamName']]
+            for i, (abbreviation, full_name, team) in enumerate(top3.itertuples(index=False, name=None), 1):
+                print(f"  {i}. {abbreviation} - {full_name} ({team})")
         
         # Data availability summary
         print(f"\nData Available:")
@@ -304,7 +759,7 @@ def main():
     parser.add_argument("--event", help="Event name (alternative to --race)")
     parser.add_argument("--session", default="R", help="Session type (FP1, FP2, FP3, Q, R, S)")
     parser.add_argument("--output", default="./f1_data_output", help="Output directory")
-    parser.add_argument("--format", default="all", choices=["json", "csv", "excel", "all"], 
+    parser.add_argument("--format", default="all", choices=["json", "csv", "parquet", "excel", "all"], 
                        help="Output format")
     parser.add_argument("--cache", default="./f1_cache", help="Cache directory")
     parser.add_argument("--driver", help="Specific driver for telemetry (e.g., 'VER')")
@@ -2,14 +2,28 @@
 Utility functions and helpers.
 """
 
-from .logging import setup_logging
-from .file_utils import ensure_directory, get_timestamp
-from .data_utils import clean_dataframe, validate_race_data
+from .._lazy import lazy_getattr
+
+# Public name -> submodule defining it, imported on first access (PEP 562)
+# so that the CLI does not pay for pandas unless a data helper is used
+_LAZY_IMPORTS = {
+    "setup_logging": ".logging",
+    "ensure_directory": ".file_utils",
+    "get_timestamp": ".file_utils",
+    "write_json": ".file_utils",
+    "clean_dataframe": ".data_utils",
+    "validate_race_data": ".data_utils",
+    "calculate_statistics": ".data_utils",
+}
 
 __all__ = [
     "setup_logging",
     "ensure_directory", 
     "get_timestamp",
+    "write_json",
     "clean_dataframe",
-    "validate_race_data"
+    "validate_race_data",
+    "calculate_statistics"
 ]
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
@@ -2,44 +2,53 @@
 Data processing utilities.
 """
 
-import pandas as pd
-import numpy as np
-from typing import Dict, Any, Optional, List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
+
+# pandas is imported inside each function so importing this module stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and standardize a DataFrame."""
+    import pandas as pd
+    
     if df.empty:
         return df
     
-    # Make a copy to avoid modifying original
-    cleaned_df = df.copy()
+    # Remove completely empty rows and columns; dropna returns a new frame,
+    # so the conversions below never touch the original
+    cleaned_df = df.dropna(how='all').dropna(axis=1, how='all')
     
-    # Remove completely empty rows and columns
-    cleaned_df = cleaned_df.dropna(how='all')
-    cleaned_df = cleaned_df.dropna(axis=1, how='all')
+    # Give object columns holding plain Python values a proper dtype in one pass
+    cleaned_df = cleaned_df.infer_objects()
     
-    # Convert object columns to appropriate types where possible
-    for col in cleaned_df.columns:
-        if cleaned_df[col].dtype == 'object':
-            # Try to convert to numeric
+    # Parse what is still stored as objects: as numbers where possible,
+    # otherwise as dates when the column name suggests one
+    object_columns = [col for col, dtype in cleaned_df.dtypes.items() if dtype == 'object']
+    for col in object_columns:
+        try:
+            cleaned_df[col] = pd.to_numeric(cleaned_df[col])
+            continue
+        except (ValueError, TypeError):
+            pass
+        
+        if 'time' in col.lower() or 'date' in col.lower():
             try:
-                cleaned_df[col] = pd.to_numeric(cleaned_df[col], errors='ignore')
-            except:
+                cleaned_df[col] = pd.to_datetime(cleaned_df[col])
+            except (ValueError, TypeError):
                 pass
-            
-            # Try to convert to datetime
-            if 'time' in col.lower() or 'date' in col.lower():
-                try:
-                    cleaned_df[col] = pd.to_datetime(cleaned_df[col], errors='ignore')
-                except:
-                    pass
     
     return cleaned_df
 
 
 def validate_race_data(data: Dict[str, Any]) -> Dict[str, List[str]]:
     """Validate race data and return any issues found."""
+    import pandas as pd
+    import numpy as np
+    
     issues = {
         'errors': [],
         'warnings': []
@@ -75,8 +84,14 @@ def validate_race_data(data: Dict[str, Any]) -> Dict[str, List[str]]:
             if lap_data.empty:
                 issues['errors'].append("Lap data is empty")
             else:
-                # Check for reasonable lap count
-                max_lap = lap_data['LapNumber'].max() if 'LapNumber' in lap_data.columns else 0
+                # Check for reasonable lap count; fmax skips missing laps like
+                # Series.max() but reduces the raw array directly
+                max_lap = 0
+                if 'LapNumber' in lap_data.columns:
+                    laps = lap_data['LapNumber'].to_numpy(dtype=float, na_value=np.nan)
+                    max_lap = np.fmax.reduce(laps)
+                    if not np.isnan(max_lap):
+                        max_lap = int(max_lap)
                 if max_lap < 10:
                     issues['warnings'].append(f"Very few laps recorded: {max_lap}")
                 elif max_lap > 100:
@@ -87,6 +102,8 @@ def validate_race_data(data: Dict[str, Any]) -> Dict[str, List[str]]:
 
 def calculate_statistics(df: pd.DataFrame, column: str) -> Dict[str, Any]:
     """Calculate basic statistics for a DataFrame column."""
+    import pandas as pd
+    
     if column not in df.columns:
         return {}
     
@@ -94,15 +111,7 @@ def calculate_statistics(df: pd.DataFrame, column: str) -> Dict[str, Any]:
     
     # Handle different data types
     if pd.api.types.is_numeric_dtype(series):
-        return {
-            'count': len(series),
-            'mean': float(series.mean()) if not series.empty else None,
-            'std': float(series.std()) if not series.empty else None,
-            'min': float(series.min()) if not series.empty else None,
-            'max': float(series.max()) if not series.empty else None,
-            'median': float(series.median()) if not series.empty else None,
-            'null_count': int(series.isnull().sum())
-        }
+        return _numeric_statistics(series)
     elif pd.api.types.is_datetime64_any_dtype(series):
         return {
             'count': len(series),
@@ -121,19 +130,59 @@ def calculate_statistics(df: pd.DataFrame, column: str) -> Dict[str, Any]:
         }
 
 
+def _numeric_statistics(series: pd.Series) -> Dict[str, Any]:
+    """
+    Statistics for a numeric column, reduced from a single float array.
+    
+    Missing values are skipped the same way the pandas reductions skip them.
+    """
+    import numpy as np
+    
+    if series.empty:
+        return {
+            'count': 0,
+            'mean': None,
+            'std': None,
+            'min': None,
+            'max': None,
+            'median': None,
+            'null_count': 0
+        }
+    
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    missing = np.isnan(values)
+    null_count = int(missing.sum())
+    valid = values[~missing] if null_count else values
+    nan = float('nan')
+    
+    return {
+        'count': len(values),
+        'mean': float(valid.mean()) if valid.size else nan,
+        'std': float(valid.std(ddof=1)) if valid.size > 1 else nan,
+        'min': float(valid.min()) if valid.size else nan,
+        'max': float(valid.max()) if valid.size else nan,
+        'median': float(np.median(valid)) if valid.size else nan,
+        'null_count': null_count
+    }
+
+
 def merge_telemetry_data(telemetry_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     """Merge multiple telemetry DataFrames into one."""
+    import pandas as pd
+    import numpy as np
+    
     if not telemetry_dict:
         return pd.DataFrame()
     
-    merged_data = []
-    for driver, data in telemetry_dict.items():
-        if not data.empty:
-            data_copy = data.copy()
-            data_copy['Driver'] = driver
-            merged_data.append(data_copy)
-    
-    if merged_data:
-        return pd.concat(merged_data, ignore_index=True)
-    else:
+    frames = {driver: data for driver, data in telemetry_dict.items() if not data.empty}
+    if not frames:
         return pd.DataFrame()
+    
+    # Concatenate the frames as they are and label the rows afterwards,
+    # rather than copying each frame just to add its Driver column. Repeating
+    # an object array makes every row reference the one key string per driver
+    # instead of each row getting its own copy.
+    merged = pd.concat(frames.values(), ignore_index=True)
+    drivers = np.array(list(frames), dtype=object)
+    merged['Driver'] = np.repeat(drivers, [len(data) for data in frames.values()])
+    return merged
@@ -2,50 +2,207 @@
 File and directory utilities.
 """
 
+import json
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional; fall back to the stdlib encoder
+    orjson = None
 
 
 def ensure_directory(path: Union[str, Path]) -> Path:
     """Ensure a directory exists, creating it if necessary."""
-    path = Path(path)
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    os.makedirs(path, exist_ok=True)
+    # Only build a Path when the caller didn't pass one
+    return path if isinstance(path, Path) else Path(path)
+
 
+DEFAULT_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
 
-def get_timestamp(format_string: str = "%Y%m%d_%H%M%S") -> str:
+
+def get_timestamp(format_string: str = DEFAULT_TIMESTAMP_FORMAT) -> str:
     """Get current timestamp as formatted string."""
+    if format_string == DEFAULT_TIMESTAMP_FORMAT:
+        # time.strftime skips building a datetime; other formats may use
+        # datetime-only directives such as %f
+        return time.strftime(format_string)
     return datetime.now().strftime(format_string)
 
 
+def write_json(path: Union[str, Path], data: Any, indent: bool = True) -> None:
+    """Write data to a JSON file, stringifying values JSON can't represent."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=option))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2 if indent else None, default=str)
+
+
+# Read buffer for JSON files; large analysis files are read in a few syscalls
+JSON_READ_BUFFER = 1 << 20
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read a JSON file as bytes and parse it in one call."""
+    with open(path, 'rb', buffering=JSON_READ_BUFFER) as f:
+        content = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json.dump writes by default
+            pass
+    return json.loads(content)
+
+
+# Characters safe_filename keeps
+SAFE_FILENAME_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_."
+
+
+# Bytes safe_filename deletes; every kept character is ASCII, so names are
+# filtered as ASCII bytes with bytes.translate
+_SAFE_FILENAME_DELETE = bytes(c for c in range(256) if chr(c) not in SAFE_FILENAME_CHARS)
+
+
 def safe_filename(filename: str) -> str:
     """Create a safe filename by removing/replacing invalid characters."""
-    # Remove or replace invalid characters
-    safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_."
-    safe_filename = "".join(c for c in filename if c in safe_chars)
+    # Drop non-ASCII characters while encoding, then the remaining invalid
+    # ones (whitespace included) and leading/trailing underscores and dots
+    raw = filename.encode("ascii", "ignore").translate(None, _SAFE_FILENAME_DELETE)
+    safe_filename = raw.strip(b"_.").decode("ascii")
+    
+    return safe_filename or "unnamed"
+
+
+# Seconds a missing path is remembered by get_file_size(missing_ok=True)
+MISSING_FILE_TTL = 1.0
+
+# Path -> time.monotonic() when get_file_size last found it missing
+_missing_files: Dict[str, float] = {}
+
+
+def get_file_size(path: Union[str, Path], missing_ok: bool = False) -> int:
+    """
+    Get file size in bytes.
     
-    # Remove multiple consecutive spaces and replace with single underscore
-    safe_filename = "_".join(safe_filename.split())
+    With missing_ok, a missing file counts as 0 bytes and is not stat()ed
+    again for MISSING_FILE_TTL seconds; call get_file_size.invalidate(path)
+    after creating it.
+    """
+    if not missing_ok:
+        return os.stat(path).st_size
     
-    # Remove leading/trailing underscores and dots
-    safe_filename = safe_filename.strip("_.")
+    path = os.fspath(path)
+    missing_since = _missing_files.get(path)
+    if missing_since is not None:
+        if time.monotonic() - missing_since < MISSING_FILE_TTL:
+            return 0
+        del _missing_files[path]
     
-    return safe_filename or "unnamed"
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        _missing_files[path] = time.monotonic()
+        return 0
+
+
+def _forget_missing_file(path: Union[str, Path]) -> None:
+    """Drop a path from get_file_size's missing-file cache."""
+    _missing_files.pop(os.fspath(path), None)
+
 
+get_file_size.invalidate = _forget_missing_file
 
-def get_file_size(path: Union[str, Path]) -> int:
-    """Get file size in bytes."""
-    return Path(path).stat().st_size
 
+def get_file_sizes(paths: Iterable[Union[str, Path]]) -> Dict[str, int]:
+    """
+    Get the sizes of several files in bytes, listing each parent directory once.
+    
+    Returns a dict keyed by each path as a string; missing files are left out.
+    """
+    # Parent directory -> {file name: path as given}
+    by_parent: Dict[str, Dict[str, str]] = {}
+    for path in paths:
+        path = os.fspath(path)
+        parent, name = os.path.split(path)
+        by_parent.setdefault(parent, {})[name] = path
+    
+    sizes = {}
+    for parent, wanted in by_parent.items():
+        try:
+            entries = os.scandir(parent or os.curdir)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                path = wanted.get(entry.name)
+                if path is not None:
+                    try:
+                        sizes[path] = entry.stat().st_size
+                    except OSError:
+                        pass
+    return sizes
+
+
+def _scan_directory(path: str) -> Tuple[int, List[str]]:
+    """Sum the sizes of the files directly in a directory and list its subdirectories."""
+    size = 0
+    subdirectories = []
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return size, subdirectories
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    # Like os.walk, don't descend into symlinked directories
+                    if not entry.is_symlink():
+                        subdirectories.append(entry.path)
+                else:
+                    size += entry.stat().st_size
+            except OSError:
+                # Broken symlink or file removed during the walk
+                pass
+    return size, subdirectories
 
-def get_directory_size(path: Union[str, Path]) -> int:
-    """Get total size of directory in bytes."""
+
+def get_directory_size(path: Union[str, Path], workers: int = 1) -> int:
+    """
+    Get total size of directory in bytes.
+    
+    Directories are scanned with os.scandir, so each file costs one stat.
+    With workers > 1, subdirectories are scanned on a thread pool, which
+    overlaps filesystem latency on cold caches or network filesystems; for
+    trees already in the page cache the single-threaded walk is faster.
+    """
+    root = os.fspath(path)
     total_size = 0
-    for dirpath, dirnames, filenames in os.walk(path):
-        for filename in filenames:
-            filepath = os.path.join(dirpath, filename)
-            if os.path.exists(filepath):
-                total_size += os.path.getsize(filepath)
+    
+    if workers <= 1:
+        stack = [root]
+        while stack:
+            size, subdirectories = _scan_directory(stack.pop())
+            total_size += size
+            stack.extend(subdirectories)
+        return total_size
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_scan_directory, root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                size, subdirectories = future.result()
+                total_size += size
+                pending.update(executor.submit(_scan_directory, d) for d in subdirectories)
     return total_size
@@ -2,13 +2,54 @@
 Logging configuration and utilities.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
 from ..config import get_settings
 
+# (level, log file, format) that setup_logging last applied
+_configured_with: Optional[tuple] = None
+
+# Third-party loggers limited to WARNING and above
+QUIET_LOGGERS = ("fastf1", "matplotlib", "PIL", "urllib3")
+
+# Write buffer for the log file; records below WARNING wait here
+LOG_FILE_BUFFER = 64 * 1024
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that collects records in a large write buffer.
+    
+    StreamHandler.emit flushes after every record. Here only WARNING and
+    above are flushed at once; the rest are written when the buffer fills
+    or the handler is flushed or closed (logging.shutdown does both at exit).
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            if self.mode != 'w' or not getattr(self, '_closed', False):
+                self.stream = self._open()
+        if self.stream:
+            try:
+                self.stream.write(self.format(record) + self.terminator)
+                if record.levelno >= logging.WARNING:
+                    self.stream.flush()
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+
 
 def setup_logging(
     level: Optional[str] = None,
@@ -26,30 +67,47 @@ def setup_logging(
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
+    # Nothing to do if this configuration is already in place
+    global _configured_with
+    config = (log_level.upper(), str(log_file_path) if log_file_path else None, format_string)
+    if config == _configured_with:
+        return
+    first_setup = _configured_with is None
+    _configured_with = config
+    
+    # basicConfig ignores new handlers once the root logger has some, so only
+    # build them (and start their listener) when they will be used. Logging
+    # threads just put records on a queue; the listener thread writes them to
+    # stdout and the log file, so I/O never happens under the caller's lock.
+    handlers = None
+    if not logging.root.handlers:
+        outputs = [logging.StreamHandler(sys.stdout)]
+        if log_file_path:
+            log_file_path.parent.mkdir(parents=True, exist_ok=True)
+            # delay=True: the file is only opened once something is logged
+            outputs.append(_BufferedFileHandler(log_file_path, delay=True))
+        
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *outputs, respect_handler_level=True)
+        listener.start()
+        # Drain queued records before logging.shutdown closes the handlers
+        atexit.register(listener.stop)
+        handlers = [QueueHandler(log_queue)]
+    
     # Configure logging
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
         format=format_string,
-        handlers=_get_handlers(log_file_path)
+        handlers=handlers
     )
     
-    # Set specific loggers
-    logging.getLogger("fastf1").setLevel(logging.WARNING)
-    logging.getLogger("matplotlib").setLevel(logging.WARNING)
-    logging.getLogger("PIL").setLevel(logging.WARNING)
-
-
-def _get_handlers(log_file: Optional[Path]) -> list:
-    """Get logging handlers."""
-    handlers = [logging.StreamHandler(sys.stdout)]
-    
-    if log_file:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        handlers.append(logging.FileHandler(log_file))
-    
-    return handlers
+    # Quiet chatty third-party loggers; their levels never change afterwards
+    if first_setup:
+        for name in QUIET_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
-    """Get a logger instance."""
+    """Get a logger instance (loggers live for the whole process, so caching is safe)."""
     return logging.getLogger(name)
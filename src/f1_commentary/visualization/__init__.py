@@ -2,7 +2,14 @@
 F1 race visualization module.
 """
 
-from .incident_visualizer import F1IncidentVisualizer
-from .track_renderer import TrackRenderer
+from .._lazy import lazy_getattr
+
+# Public name -> submodule defining it, imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "F1IncidentVisualizer": ".incident_visualizer",
+    "TrackRenderer": ".track_renderer",
+}
 
 __all__ = ["F1IncidentVisualizer", "TrackRenderer"]
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
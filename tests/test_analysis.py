@@ -0,0 +1,73 @@
+"""
+Tests for race analysis.
+"""
+
+import pandas as pd
+from f1_commentary.analysis import F1RaceAnalyzer
+
+
+def _write_race(data_dir, name, drivers, messages):
+    """Write a minimal set of race CSVs, as collected by the data collector."""
+    race_dir = data_dir / f"{name}_R_20240101"
+    race_dir.mkdir()
+
+    pd.DataFrame([
+        {'Driver': driver, 'LapNumber': lap, 'Position': position,
+         'LapTime': '0 days 00:01:30.123000', 'Compound': 'SOFT', 'TyreLife': lap, 'PitInTime': None}
+        for lap in (1, 2, 3)
+        for position, driver in enumerate(drivers if lap % 2 else drivers[::-1], 1)
+    ]).to_csv(race_dir / 'lap_data.csv', index=False)
+    pd.DataFrame({
+        'Time': ['2024-01-01 00:00:00'] * len(messages),
+        'Lap': range(1, len(messages) + 1),
+        'Message': messages,
+        'Category': ['Other'] * len(messages),
+    }).to_csv(race_dir / 'race_control_messages.csv', index=False)
+    pd.DataFrame({
+        'DriverNumber': range(1, len(drivers) + 1), 'Abbreviation': drivers, 'FullName': drivers,
+        'TeamName': ['Team'] * len(drivers), 'Time': ['0 days 01:30:00'] * len(drivers),
+        'Points': [25] * len(drivers),
+    }).to_csv(race_dir / 'session_results.csv', index=False)
+    pd.DataFrame({'AirTemp': [20.0], 'TrackTemp': [30.0], 'Humidity': [50.0], 'Pressure': [1000.0],
+                  'WindSpeed': [1.0], 'Rainfall': [False]}).to_csv(race_dir / 'weather_data.csv', index=False)
+    pd.DataFrame({'Status': ['1']}).to_csv(race_dir / 'track_status.csv', index=False)
+    pd.DataFrame({'Status': ['Started']}).to_csv(race_dir / 'session_status.csv', index=False)
+
+
+def test_statistics_follow_loaded_race(tmp_path):
+    """Test that loading another race drops the previous race's results."""
+    _write_race(tmp_path, "Alpha", ['AAA', 'BBB', 'CCC'], [
+        'YELLOW IN TRACK SECTOR 3',
+        'FIA STEWARDS: LAP 2 TURN 1 INCIDENT INVOLVING CARS 1 (AAA) AND 2 (BBB) NOTED - COLLISION',
+    ])
+    _write_race(tmp_path, "Beta", ['AAA', 'BBB'], ['GREEN LIGHT - PIT EXIT OPEN'])
+
+    analyzer = F1RaceAnalyzer(str(tmp_path))
+    assert analyzer.load_race_data("Alpha")
+    stats = analyzer.generate_comprehensive_analysis()['statistics']
+    assert stats['total_incidents'] == 1
+    assert stats['yellow_flag_periods'] == 1
+
+    assert analyzer.load_race_data("Beta")
+    assert analyzer.analysis_results == {}
+    stats = analyzer._generate_statistics()
+    assert stats['total_incidents'] == 0
+    assert stats['yellow_flag_periods'] == 0
+    assert stats['total_position_changes'] == 4
+
+
+def test_analysis_results_are_not_shared(tmp_path):
+    """Test that modifying a returned analysis leaves later results intact."""
+    _write_race(tmp_path, "Alpha", ['AAA', 'BBB'], [
+        'FIA STEWARDS: LAP 2 TURN 1 INCIDENT INVOLVING CARS 1 (AAA) AND 2 (BBB) NOTED - COLLISION',
+    ])
+    analyzer = F1RaceAnalyzer(str(tmp_path))
+    assert analyzer.load_race_data("Alpha")
+
+    segments = analyzer.identify_commentary_segments()
+    segments[0]['drivers'].append('ZZZ')
+    analyzer.analyze_incidents().clear()
+
+    incidents = analyzer.analyze_incidents()
+    assert len(incidents) == 1
+    assert 'ZZZ' not in incidents[0]['drivers']
@@ -2,19 +2,21 @@
 Tests for configuration management.
 """
 
+import os
 import pytest
 from pathlib import Path
-from f1_commentary.config import Settings, get_settings, APIKeyManager
+from f1_commentary.config import Settings, get_settings, APIKeyManager, get_key_manager
 
 
-def test_settings_creation():
+def test_settings_creation(tmp_path):
     """Test settings creation and defaults."""
-    settings = Settings()
+    settings = Settings(cache_dir=tmp_path / "cache", output_dir=tmp_path / "output")
     
+    # Directories are only created when first needed
+    assert not settings.cache_dir.exists()
+    assert settings.ensure_cache_dir() == settings.cache_dir
     assert settings.cache_dir.exists()
-    assert settings.output_dir.exists()
-    assert settings.analysis_dir.exists()
-    assert settings.visualization_dir.exists()
+    assert not settings.output_dir.exists()
     assert settings.default_groq_model == "llama-3.1-8b-instant"
 
 
@@ -49,3 +51,19 @@ def test_api_key_manager():
     # Test validation
     validation = key_manager.validate_keys()
     assert isinstance(validation, dict)
+
+
+def test_get_key_manager_cached(tmp_path):
+    """Test that the key manager is shared until the .env file changes."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("TEST_API_KEY=first\n")
+    
+    manager = get_key_manager(env_file)
+    assert get_key_manager(env_file) is manager
+    assert manager.get_key("TEST_API_KEY") == "first"
+    
+    env_file.write_text("TEST_API_KEY=second\n")
+    os.utime(env_file, (0, 0))
+    reloaded = get_key_manager(env_file)
+    assert reloaded is not manager
+    assert reloaded.get_key("TEST_API_KEY") == "second"
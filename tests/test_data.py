@@ -0,0 +1,47 @@
+"""
+Tests for race data collection.
+"""
+
+import json
+import pytest
+import pandas as pd
+
+collector = pytest.importorskip("f1_commentary.data.collector")
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_write_json_split_keeps_float_precision(tmp_path, pretty):
+    """Test that exported floats survive a JSON round trip."""
+    df = pd.DataFrame({
+        'Driver': ['VER', 'HAM'],
+        'Value': [0.025002083516, 312.123456789012],
+    })
+    data_collector = collector.F1DataCollector(cache_dir=str(tmp_path / "cache"))
+
+    name = data_collector._write_json_split(df, tmp_path / "values.json", pretty=pretty)
+    with open(tmp_path / name) as f:
+        written = json.load(f)
+
+    assert written['columns'] == ['Driver', 'Value']
+    assert [row[1] for row in written['data']] == df['Value'].tolist()
+
+
+@pytest.mark.parametrize("downcast", [False, True])
+def test_write_frames_parquet_mixed_drivers(tmp_path, downcast):
+    """Test that drivers whose frames infer different types share one file."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    frames = [
+        # First driver: all-missing text and small integers
+        ('VER', pd.DataFrame({'Source': [None, None], 'Count': [1, 2], 'Distance': [0.5, 1.5]})),
+        ('HAM', pd.DataFrame({'Source': ['car', 'pos'], 'Count': [2**40, 3], 'Distance': [2.5, 3.5]})),
+    ]
+    data_collector = collector.F1DataCollector(cache_dir=str(tmp_path / "cache"))
+    path = tmp_path / "car_telemetry.parquet"
+
+    data_collector._write_frames_parquet(iter(frames), path, downcast=downcast)
+
+    written = pq.read_table(path).to_pandas()
+    assert written['Driver'].tolist() == ['VER', 'VER', 'HAM', 'HAM']
+    assert written['Source'].tolist()[2:] == ['car', 'pos']
+    assert written['Count'].tolist() == [1, 2, 2**40, 3]
+    assert written['Distance'].tolist() == [0.5, 1.5, 2.5, 3.5]